@@ -1,33 +1,62 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Request, request, jsonify, send_from_directory
 from flask_cors import CORS
-import os
 import json
 from werkzeug.utils import secure_filename
 from datetime import datetime
 import sqlite3
-from resume_parser import ResumeParser
+import threading
+from tempfile import SpooledTemporaryFile
+from resume_parser import ResumeParser, PARSER_VERSION
 from skill_matcher import SkillMatcher
 from interview_recommender import InterviewRecommender
 from database import Database
+from parse_cache import ParseCache
+from isolated_parser import parse_isolated, PARSE_FAILED
+from instrumentation import StageTimings, StageStats
+from ranker import CandidateRanker
+from job_scorer import JobScorer
+
+class UploadRequest(Request):
+    """Request that keeps uploaded files in memory below UPLOAD_SPOOL_THRESHOLD"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Larger uploads roll over to an anonymous temp file, never a shared path
+        return SpooledTemporaryFile(max_size=app.config['UPLOAD_SPOOL_THRESHOLD'], mode='rb+')
 
 app = Flask(__name__)
+app.request_class = UploadRequest
 CORS(app)
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt', 'doc'}
 
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['UPLOAD_SPOOL_THRESHOLD'] = 2 * 1024 * 1024  # Spool to disk above 2MB
+app.config['ISOLATED_PARSING'] = True  # Parse in a sandboxed subprocess
+app.config['PARSE_TIMEOUT'] = 30  # Seconds before an isolated parse is killed
+app.config['PARSE_MEMORY_LIMIT'] = 512 * 1024 * 1024  # Extra bytes an isolated parse may allocate
+app.config['MAX_RANK_K'] = 1000  # Largest k accepted by /api/rank
 
 # Initialize components
-db = Database()
-resume_parser = ResumeParser()
 skill_matcher = SkillMatcher()
+db = Database(skill_normalizer=skill_matcher.normalize_skills)
+resume_parser = ResumeParser()
+parse_cache = ParseCache(PARSER_VERSION, db_path=db.db_path)
 interview_recommender = InterviewRecommender()
+ranker = CandidateRanker(db, skill_matcher)
+job_scorer = JobScorer(db, skill_matcher)
+# Per-stage upload timings aggregated across requests
+stage_stats = StageStats()
+
+def warmup():
+    """Load NLP and ML dependencies ahead of the first upload"""
+    resume_parser.warmup()
+    skill_matcher.warmup()
 
-# Create upload folder if it doesn't exist
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+def debug_requested():
+    """Whether the client asked for debug output (?debug=1 or a debug form field)"""
+    value = request.args.get('debug') or request.form.get('debug') or ''
+    return value.lower() in ('1', 'true', 'yes')
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -36,6 +65,10 @@ def allowed_file(filename):
 def index():
     return send_from_directory('frontend/build', 'index.html')
 
+@app.route('/api/health', methods=['GET'])
+def health():
+    return jsonify({'status': 'ok'})
+
 @app.route('/api/upload-resume', methods=['POST'])
 def upload_resume():
     try:
@@ -48,45 +81,81 @@ def upload_resume():
         
         if file and allowed_file(file.filename):
             filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            timings = StageTimings()
+            
+            # Parse resume straight from the upload stream, reusing the
+            # stored result for identical files
+            with timings.stage('parse_cache_lookup'):
+                content_hash = parse_cache.hash_stream(file.stream)
+                resume_data = parse_cache.get(content_hash)
+            if resume_data is None:
+                file.stream.seek(0)
+                if app.config['ISOLATED_PARSING']:
+                    result = parse_isolated(
+                        resume_parser, file.stream, filename,
+                        timeout=app.config['PARSE_TIMEOUT'],
+                        memory_limit=app.config['PARSE_MEMORY_LIMIT'],
+                        timings=timings
+                    )
+                    if result['error'] == PARSE_FAILED:
+                        resume_data = resume_parser.empty_result()
+                    elif result['error']:
+                        # Timeouts and memory limit hits
+                        stage_stats.record(timings)
+                        return jsonify({'error': result['error'], 'message': result['message']}), 422
+                    else:
+                        resume_data = result['resume_data']
+                else:
+                    resume_data = resume_parser.parse_resume(file.stream, filename, timings)
+                # Failed parses come back without text and are not cached
+                if resume_data['raw_text']:
+                    parse_cache.put(content_hash, resume_data)
             
-            # Parse resume
-            resume_data = resume_parser.parse_resume(filepath)
+            # The full text is stored on its own, not returned or kept on the row
+            full_text = resume_data.pop('text', '')
             
             # Get job requirements from request
             job_requirements = request.form.get('job_requirements', '')
             
             # Match skills
             match_score, matched_skills, missing_skills = skill_matcher.match_skills(
-                resume_data['skills'], job_requirements
+                resume_data['skills'], job_requirements, timings
             )
             
             # Generate interview recommendations
             interview_recommendations = interview_recommender.generate_recommendations(
-                resume_data, match_score, matched_skills, missing_skills
+                resume_data, match_score, matched_skills, missing_skills, timings
             )
             
             # Save to database
-            candidate_id = db.save_candidate({
-                'name': resume_data['name'],
-                'email': resume_data['email'],
-                'phone': resume_data['phone'],
-                'skills': resume_data['skills'],
-                'experience': resume_data['experience'],
-                'education': resume_data['education'],
-                'match_score': match_score,
-                'matched_skills': matched_skills,
-                'missing_skills': missing_skills,
-                'interview_recommendations': interview_recommendations,
-                'resume_file': filename,
-                'upload_date': datetime.now().isoformat()
-            })
+            with timings.stage('save_candidate'):
+                candidate_id = db.save_candidate({
+                    'name': resume_data['name'],
+                    'email': resume_data['email'],
+                    'phone': resume_data['phone'],
+                    'skills': resume_data['skills'],
+                    'experience': resume_data['experience'],
+                    'education': resume_data['education'],
+                    'match_score': match_score,
+                    'matched_skills': matched_skills,
+                    'missing_skills': missing_skills,
+                    'interview_recommendations': interview_recommendations,
+                    'resume_file': filename,
+                    'upload_date': datetime.now().isoformat(),
+                    'parser_version': PARSER_VERSION,
+                    'category_breakdown': skill_matcher.category_breakdown(resume_data['skills'])
+                })
+                if candidate_id and full_text:
+                    db.save_candidate_text(candidate_id, full_text)
             
-            # Clean up uploaded file
-            os.remove(filepath)
+            # Score the new candidate against every open job
+            if candidate_id:
+                with timings.stage('score_jobs'):
+                    job_scorer.score_candidates([(candidate_id, resume_data['skills'])])
             
-            return jsonify({
+            stage_stats.record(timings)
+            
+            response = {
                 'success': True,
                 'candidate_id': candidate_id,
                 'resume_data': resume_data,
@@ -94,7 +163,10 @@ def upload_resume():
                 'matched_skills': matched_skills,
                 'missing_skills': missing_skills,
                 'interview_recommendations': interview_recommendations
-            })
+            }
+            if debug_requested():
+                response['timings'] = timings.to_dict()
+            return jsonify(response)
         
         return jsonify({'error': 'Invalid file type'}), 400
     
@@ -119,27 +191,195 @@ def get_candidate(candidate_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/candidate/<int:candidate_id>/text', methods=['GET'])
+def get_candidate_text(candidate_id):
+    try:
+        text = db.get_candidate_text(candidate_id)
+        if text is not None:
+            return jsonify({'candidate_id': candidate_id, 'text': text})
+        return jsonify({'error': 'Candidate text not found'}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/candidates/by-skills', methods=['GET'])
+def get_candidates_by_skills():
+    try:
+        skills = [skill.strip() for skill in request.args.get('skills', '').split(',') if skill.strip()]
+        match = request.args.get('match', 'any')
+        if match not in ('any', 'all'):
+            return jsonify({'error': "match must be 'any' or 'all'"}), 400
+        
+        candidates = db.get_candidates_with_skills(skills, match) if skills else []
+        return jsonify({'candidates': candidates})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/rank', methods=['GET'])
+def rank_candidates():
+    try:
+        requirements = request.args.get('requirements', '')
+        try:
+            k = int(request.args.get('k', 50))
+        except ValueError:
+            return jsonify({'error': 'k must be an integer'}), 400
+        if k < 1 or k > app.config['MAX_RANK_K']:
+            return jsonify({'error': f"k must be between 1 and {app.config['MAX_RANK_K']}"}), 400
+        
+        ranked, stats = ranker.top_k(requirements, k)
+        return jsonify({
+            'candidates': [
+                dict(candidate, rank_score=score, rank_matched_skills=matched_skills, rank_missing_skills=missing_skills)
+                for candidate, score, matched_skills, missing_skills in ranked
+            ],
+            'stats': stats
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/update-job-requirements', methods=['POST'])
 def update_job_requirements():
     try:
         data = request.get_json()
         requirements = data.get('requirements', '')
         
-        # Update skill matcher with new requirements
-        skill_matcher.update_requirements(requirements)
+        # Update skill matcher with new requirements, compiled once
+        plan = skill_matcher.update_requirements(requirements)
         
-        # Recalculate scores for all candidates
-        candidates = db.get_all_candidates()
-        for candidate in candidates:
-            match_score, matched_skills, missing_skills = skill_matcher.match_skills(
-                candidate['skills'], requirements
-            )
-            db.update_candidate_score(candidate['id'], match_score, matched_skills, missing_skills)
+        # Fully rescore, in one vectorized pass, only the candidates sharing a
+        # skill or a TF-IDF term with the requirements
+        overlap_skills = skill_matcher.overlap_skills(plan, db.get_skill_vocabulary())
+        candidates = db.get_candidates_with_skills(overlap_skills) if overlap_skills else []
+        results = skill_matcher.match_many(
+            [candidate['skills'] for candidate in candidates], plan,
+            [candidate.get('category_breakdown') for candidate in candidates]
+        )
+        db.update_candidate_scores(
+            (candidate['id'], match_score, matched_skills, missing_skills)
+            for candidate, (match_score, matched_skills, missing_skills) in zip(candidates, results)
+        )
+        
+        # Everyone else matches nothing; their score depends only on how
+        # many skills they have
+        scores_by_skill_count = {
+            skill_count: skill_matcher.score_without_overlap(skill_count, plan)
+            for skill_count in db.get_unmatched_skill_counts(overlap_skills)
+        }
+        db.update_unmatched_candidate_scores(
+            overlap_skills, scores_by_skill_count, skill_matcher.skill_index.to_skills(plan.required_bits)
+        )
         
         return jsonify({'success': True, 'message': 'Job requirements updated'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/jobs', methods=['GET'])
+def get_jobs():
+    try:
+        jobs = db.get_jobs(request.args.get('status'))
+        return jsonify({'jobs': jobs})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    try:
+        data = request.get_json() or {}
+        title = data.get('title', '').strip()
+        requirements = data.get('requirements', '')
+        if not title or not requirements:
+            return jsonify({'error': 'title and requirements are required'}), 400
+        
+        job_id = db.save_job(title, requirements)
+        if job_id is None:
+            return jsonify({'error': 'Could not save job'}), 500
+        
+        # Score every candidate against the new job
+        job_scorer.rescore_jobs([job_id])
+        return jsonify({'success': True, 'job_id': job_id})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/<int:job_id>', methods=['PUT'])
+def update_job(job_id):
+    try:
+        data = request.get_json() or {}
+        status = data.get('status')
+        if status not in (None, 'open', 'closed'):
+            return jsonify({'error': "status must be 'open' or 'closed'"}), 400
+        
+        if not db.update_job(job_id, data.get('title'), data.get('requirements'), status):
+            return jsonify({'error': 'Job not found'}), 404
+        
+        # New requirements or a reopened job need fresh scores
+        if data.get('requirements') is not None or status == 'open':
+            job_scorer.rescore_jobs([job_id])
+        return jsonify({'success': True, 'job': db.get_job(job_id)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/<int:job_id>', methods=['DELETE'])
+def delete_job(job_id):
+    try:
+        if db.delete_job(job_id):
+            return jsonify({'success': True, 'message': 'Job deleted'})
+        return jsonify({'error': 'Job not found'}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/jobs/rescore', methods=['POST'])
+def rescore_jobs():
+    try:
+        # E.g. after re-extraction or a similarity model refit
+        scores = job_scorer.rescore_jobs()
+        return jsonify({'success': True, 'scores': scores})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/candidate/<int:candidate_id>/best-jobs', methods=['GET'])
+def get_best_jobs(candidate_id):
+    try:
+        try:
+            limit = int(request.args.get('limit', 5))
+        except ValueError:
+            return jsonify({'error': 'limit must be an integer'}), 400
+        if limit < 1:
+            return jsonify({'error': 'limit must be at least 1'}), 400
+        
+        candidate = db.get_candidate(candidate_id)
+        if not candidate:
+            return jsonify({'error': 'Candidate not found'}), 404
+        return jsonify({'candidate_id': candidate_id, 'jobs': job_scorer.best_jobs(candidate, limit)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/parse-cache', methods=['GET'])
+def get_parse_cache_statistics():
+    try:
+        return jsonify(parse_cache.get_statistics())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/similarity-model', methods=['GET'])
+def get_similarity_model_statistics():
+    try:
+        return jsonify(skill_matcher.similarity_model.get_statistics())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/normalization-cache', methods=['GET'])
+def get_normalization_cache_statistics():
+    try:
+        return jsonify(skill_matcher.get_normalization_statistics())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/stage-timings', methods=['GET'])
+def get_stage_timings():
+    try:
+        return jsonify({'stages': stage_stats.summary()})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/delete-candidate/<int:candidate_id>', methods=['DELETE'])
 def delete_candidate(candidate_id):
     try:
@@ -161,6 +401,9 @@ def get_statistics():
 if __name__ == '__main__':
     # Initialize database
     db.init_database()
+    # Warm up in the background so the server answers health checks right away
+    threading.Thread(target=warmup, daemon=True).start()
     print("Starting AI Resume Screening Server...")
     print("Server running on http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # SkillMatcher and the parse cache are safe to share across request threads
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark DOCX text extraction on a synthetic corpus.
+
+Compares the original python-docx paragraph loop against the streaming
+docx_reader, and reports how much table text each one recovers. Run from
+the resumescreening directory:
+
+    python benchmarks/bench_docx_extraction.py [num_docs] [paragraphs_per_doc]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+from docx_reader import extract_docx_text
+
+SKILLS_GRID = [
+    ['Python', 'Django', 'PostgreSQL'],
+    ['Docker', 'Kubernetes', 'AWS'],
+    ['React', 'TypeScript', 'Jest'],
+]
+
+
+def make_docx(index, paragraphs):
+    """Build a resume-like DOCX with body paragraphs and a skills table"""
+    doc = Document()
+    doc.add_paragraph(f"Candidate {index}")
+    doc.add_paragraph("Experience")
+    for i in range(paragraphs):
+        doc.add_paragraph(f"- Built and operated service {i} for team {index}, improving latency by {i % 40}%.")
+    doc.add_paragraph("Skills")
+    table = doc.add_table(rows=len(SKILLS_GRID), cols=len(SKILLS_GRID[0]))
+    for row, skills in zip(table.rows, SKILLS_GRID):
+        for cell, skill in zip(row.cells, skills):
+            cell.text = skill
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx_text(stream):
+    """The original extract_text_from_docx loop"""
+    doc = Document(stream)
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    return text
+
+
+def run(func, corpus):
+    start = time.perf_counter()
+    texts = [func(data) for data in corpus]
+    return time.perf_counter() - start, texts
+
+
+def main():
+    num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    paragraphs = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    corpus = [make_docx(i, paragraphs) for i in range(num_docs)]
+    print(f"Corpus: {num_docs} documents, {paragraphs} paragraphs + a 3x3 skills table each")
+
+    print(f"{'extractor':<14} {'total (s)':>10} {'docs/sec':>10} {'table cells found':>18}")
+    for label, func in [('python-docx', python_docx_text), ('docx_reader', extract_docx_text)]:
+        elapsed, texts = run(lambda data: func(io.BytesIO(data)), corpus)
+        cells = sum(skill in texts[0] for row in SKILLS_GRID for skill in row)
+        print(f"{label:<14} {elapsed:>10.2f} {num_docs / elapsed:>10.1f} {cells:>15}/{sum(map(len, SKILLS_GRID))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark scoring many candidates against many jobs.
+
+For synthetic candidates drawn from the skills taxonomy and synthetic job
+requirement texts, compares three ways of filling the candidates x jobs
+score table:
+  - nested loops over match_skills (timed on a sample of candidates and
+    projected to the whole pool, since it is far too slow to run in full)
+  - one match_many call per job
+  - one SkillMatcher.score_matrix call, i.e. a few sparse matrix products
+and checks that all three agree. Run from the resumescreening directory:
+
+    python benchmarks/bench_job_scores.py [num_candidates] [num_jobs] [loop_sample]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from resume_parser import ResumeParser
+from skill_matcher import SkillMatcher
+
+# Skills the requirements extraction recognizes, for synthetic job texts
+JOB_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'C++', 'Go', 'Rust', 'React', 'Angular', 'Node.js',
+    'Django', 'Flask', 'Spring', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQL Server',
+    'AWS', 'Azure', 'Google Cloud', 'Docker', 'Kubernetes', 'Terraform', 'Jenkins',
+    'pandas', 'numpy', 'TensorFlow', 'PyTorch', 'Spark', 'Flutter', 'React Native',
+    'Selenium', 'Jest', 'Cypress', 'Figma', 'Photoshop', 'Agile', 'Scrum', 'Jira',
+    'leadership', 'communication', 'teamwork', 'problem solving',
+]
+
+
+def make_candidates(num_candidates, seed=0):
+    rng = random.Random(seed)
+    taxonomy = sorted({skill for skills in ResumeParser().skills_db.values() for skill in skills})
+    return [rng.sample(taxonomy, rng.randint(3, 20)) for _ in range(num_candidates)]
+
+
+def make_jobs(num_jobs, seed=1):
+    rng = random.Random(seed)
+    return [
+        f"Role {i}: " + ', '.join(rng.sample(JOB_SKILLS, rng.randint(3, 12))) + '.'
+        for i in range(num_jobs)
+    ]
+
+
+def main():
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    num_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    loop_sample = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    candidates = make_candidates(num_candidates)
+    jobs = make_jobs(num_jobs)
+    matcher = SkillMatcher(similarity_model_path=None).warmup()
+    plans = [matcher.compile_requirements(job) for job in jobs]
+    # Memoize normalization and assign skill ids before timing anything
+    matcher.score_matrix(candidates, plans[:1])
+
+    print(f"candidates: {num_candidates}, jobs: {num_jobs}, pairs: {num_candidates * num_jobs}")
+
+    sample = candidates[:loop_sample]
+    start = time.perf_counter()
+    loop_scores = np.array([[matcher.match_skills(skills, plan)[0] for plan in plans] for skills in sample])
+    loop_seconds = (time.perf_counter() - start) * num_candidates / len(sample)
+    print(f"nested match_skills:  {loop_seconds:8.2f}s (projected from {len(sample)} candidates)")
+
+    start = time.perf_counter()
+    many_scores = np.column_stack([[score for score, _, _ in matcher.match_many(candidates, plan)] for plan in plans])
+    many_seconds = time.perf_counter() - start
+    print(f"match_many per job:   {many_seconds:8.2f}s")
+
+    start = time.perf_counter()
+    matrix_scores = matcher.score_matrix(candidates, plans)
+    matrix_seconds = time.perf_counter() - start
+    print(f"score_matrix:         {matrix_seconds:8.2f}s "
+          f"({loop_seconds / matrix_seconds:.0f}x nested, {many_seconds / matrix_seconds:.1f}x match_many)")
+
+    difference = max(
+        np.abs(matrix_scores[:len(sample)] - loop_scores).max(),
+        np.abs(matrix_scores - many_scores).max()
+    )
+    if difference > 1e-9:
+        print(f"✗ Scores differ by up to {difference:.3g}")
+        sys.exit(1)
+    print(f"✓ All methods agree (max difference {difference:.3g})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark SkillMatcher.match_many against a loop over match_skills.
+
+Scores the same synthetic candidate pool both ways and reports the time of
+each and the largest score difference between them. Run from the
+resumescreening directory:
+
+    python benchmarks/bench_match_many.py [num_candidates]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matcher import SkillMatcher
+
+SKILL_POOL = [
+    'python', 'java', 'javascript', 'react', 'node.js', 'c++', 'aws', 'docker',
+    'kubernetes', 'sql', 'postgresql', 'mongodb', 'machine learning', 'pandas',
+    'django', 'flask', 'git', 'agile', 'scrum', 'leadership', 'communication',
+    'teamwork', 'figma', 'photoshop', 'excel', 'tableau', 'terraform', 'linux',
+]
+
+REQUIREMENTS = """We are hiring a backend engineer with Python, Django and PostgreSQL.
+Experience with AWS, Docker and Kubernetes is required. Strong communication
+and leadership skills; agile teams."""
+
+
+def main():
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(0)
+    candidates = [rng.sample(SKILL_POOL, rng.randint(0, 15)) for _ in range(num_candidates)]
+
+    matcher = SkillMatcher()
+    plan = matcher.compile_requirements(REQUIREMENTS)
+    matcher.match_many(candidates[:10], plan)
+
+    start = time.perf_counter()
+    looped = [matcher.match_skills(skills, plan) for skills in candidates]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = matcher.match_many(candidates, plan)
+    batch_seconds = time.perf_counter() - start
+
+    max_diff = max(abs(a[0] - b[0]) for a, b in zip(looped, batched))
+
+    print(f"candidates:      {num_candidates}")
+    print(f"match_skills:    {loop_seconds:.3f}s")
+    print(f"match_many:      {batch_seconds:.3f}s ({loop_seconds / batch_seconds:.1f}x)")
+    print(f"max score diff:  {max_diff:.2e}")
+    print(f"normalize memo:  {matcher.get_normalization_statistics()['hit_rate']:.1%} hit rate")
+
+
+if __name__ == '__main__':
+    main()
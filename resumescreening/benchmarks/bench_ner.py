@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark name extraction throughput (docs/sec).
+
+Compares the original path (full en_core_web_sm pipeline, one nlp() call
+per document) against the NER-only pipeline run through nlp.pipe. Run from
+the resumescreening directory:
+
+    python benchmarks/bench_ner.py [num_docs]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import spacy
+
+from resume_parser import NER_EXCLUDE, NER_WINDOW
+
+SAMPLE_RESUME = """Jane Doe
+Senior Software Engineer
+jane.doe@example.com | (555) 123-4567 | Austin, Texas
+
+Summary
+Backend engineer with 6 years of experience at Example Corp and Acme Inc building
+data platforms in Python and Go. Worked with Maria Garcia on the payments team.
+
+Experience
+Senior Software Engineer - Example Corp (2019 - Present)
+- Led a team of five engineers migrating services to Kubernetes on AWS.
+"""
+
+
+def per_call(nlp, texts):
+    for text in texts:
+        [ent for ent in nlp(text[:NER_WINDOW]).ents if ent.label_ == "PERSON"]
+
+
+def piped(nlp, texts, batch_size):
+    for doc in nlp.pipe((text[:NER_WINDOW] for text in texts), batch_size=batch_size):
+        [ent for ent in doc.ents if ent.label_ == "PERSON"]
+
+
+def docs_per_sec(func, num_docs):
+    start = time.perf_counter()
+    func()
+    return num_docs / (time.perf_counter() - start)
+
+
+def main():
+    num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    try:
+        full_nlp = spacy.load("en_core_web_sm")
+        ner_nlp = spacy.load("en_core_web_sm", exclude=NER_EXCLUDE)
+    except OSError:
+        print("SpaCy model not found. Please run: python -m spacy download en_core_web_sm")
+        sys.exit(1)
+
+    texts = [f"{SAMPLE_RESUME}\nReference #{i}" for i in range(num_docs)]
+
+    # Warm up both pipelines so model initialization is not timed
+    per_call(full_nlp, texts[:5])
+    per_call(ner_nlp, texts[:5])
+
+    print(f"Documents: {num_docs}")
+    print(f"{'path':<36} {'docs/sec':>10}")
+    print(f"{'full pipeline, per call':<36} {docs_per_sec(lambda: per_call(full_nlp, texts), num_docs):>10.1f}")
+    print(f"{'NER only, per call':<36} {docs_per_sec(lambda: per_call(ner_nlp, texts), num_docs):>10.1f}")
+    for batch_size in [8, 32, 128]:
+        label = f"NER only, nlp.pipe (batch {batch_size})"
+        rate = docs_per_sec(lambda: piped(ner_nlp, texts, batch_size), num_docs)
+        print(f"{label:<36} {rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark top-K ranking against a full rescore on a large candidate pool.
+
+Builds a database of synthetic candidates drawn from the skills taxonomy
+(kept between runs, so only the first run pays for it), then for a few
+requirement texts compares CandidateRanker.top_k with scoring every
+candidate through match_many and taking the best k. Reports both times,
+how many candidates the ranker actually scored, and whether both return
+the same candidates and scores. Run from the resumescreening directory:
+
+    python benchmarks/bench_rank.py [num_candidates] [k] [db_path]
+"""
+
+import heapq
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Database
+from ranker import CandidateRanker
+from resume_parser import ResumeParser
+from skill_matcher import SkillMatcher
+
+REQUIREMENTS = [
+    "Senior backend engineer: Python, Django, PostgreSQL, Redis, AWS, Docker and Kubernetes. Leadership.",
+    "Frontend developer with JavaScript, React, Angular, HTML and CSS; Figma and Jest. Teamwork.",
+    "Data scientist: Python, pandas, numpy, TensorFlow, PyTorch, Spark and SQL Server.",
+    "Mobile engineer: Swift, Kotlin, Flutter and React Native.",
+]
+
+
+def build_database(db_path, num_candidates, matcher):
+    """Fill db_path with num_candidates synthetic candidates unless it already has them"""
+    db = Database(db_path, skill_normalizer=matcher.normalize_skills)
+    conn = db.get_connection()
+    existing = conn.execute('SELECT COUNT(*) FROM candidates').fetchone()[0]
+    conn.close()
+    if existing >= num_candidates:
+        return db
+
+    taxonomy = sorted({skill for skills in ResumeParser().skills_db.values() for skill in skills})
+    rng = random.Random(0)
+    # Zipf-like popularity so some skills are far more common than others
+    weights = [1.0 / (rank + 1) ** 0.8 for rank in range(len(taxonomy))]
+    rng.shuffle(weights)
+
+    start = time.perf_counter()
+    rows = []
+    for i in range(existing, num_candidates):
+        skills = list(dict.fromkeys(rng.choices(taxonomy, weights, k=rng.randint(3, 20))))
+        rows.append((
+            f"Candidate {i}", json.dumps(skills), '[]', '[]', 0.0, '[]', '[]', '[]',
+            json.dumps(matcher.category_breakdown(skills))
+        ))
+
+    conn = db.get_connection()
+    conn.executemany('''
+        INSERT INTO candidates (
+            name, skills, experience, education, match_score, matched_skills,
+            missing_skills, interview_recommendations, category_breakdown
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+    db.rebuild_skill_index()
+    print(f"Built {num_candidates - existing} candidates in {time.perf_counter() - start:.1f}s")
+    return db
+
+
+def full_rescore(db, matcher, requirements, k):
+    """Score every candidate and keep the best k (score desc, id asc)"""
+    candidates = db.get_all_candidates()
+    results = matcher.match_many(
+        [candidate['skills'] for candidate in candidates], requirements,
+        [candidate.get('category_breakdown') for candidate in candidates]
+    )
+    best = heapq.nlargest(k, ((score, -candidate['id']) for candidate, (score, _, _) in zip(candidates, results)))
+    return [(-negative_id, score) for score, negative_id in best]
+
+
+def main():
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    db_path = sys.argv[3] if len(sys.argv) > 3 else f"bench_rank_{num_candidates}.db"
+
+    matcher = SkillMatcher(similarity_model_path=None)
+    db = build_database(db_path, num_candidates, matcher)
+    ranker = CandidateRanker(db, matcher)
+    matcher.warmup()
+
+    print(f"candidates: {num_candidates}, k: {k}, database: {db_path}")
+    for requirements in REQUIREMENTS:
+        start = time.perf_counter()
+        expected = full_rescore(db, matcher, requirements, k)
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ranked, stats = ranker.top_k(requirements, k)
+        rank_seconds = time.perf_counter() - start
+
+        got = [(candidate['id'], score) for candidate, score, _, _ in ranked]
+        same = len(got) == len(expected) and all(
+            got_id == expected_id and abs(got_score - expected_score) < 1e-9
+            for (got_id, got_score), (expected_id, expected_score) in zip(got, expected)
+        )
+
+        print(f"\n{requirements[:60]}...")
+        print(f"  full rescore: {full_seconds:7.3f}s")
+        print(f"  top_k:        {rank_seconds:7.3f}s ({full_seconds / rank_seconds:.1f}x), "
+              f"scored {stats['scored_candidates']} of {stats['overlapping_candidates']} overlapping, "
+              f"pruned {stats['pruned_candidates']}")
+        print(f"  same top {k}:   {'yes' if same else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared ResumeDocument against per-extractor text handling.
+
+The "per extractor" path hands every extractor the raw string, so each one
+lowercases and splits the text itself (the behaviour before
+ResumeDocument). The "shared" path builds one ResumeDocument per resume
+and passes it to all of them. Reports time and peak traced allocations per
+resume, summed over the extractors. Run from the resumescreening directory:
+
+    python benchmarks/bench_resume_document.py [repeat]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resume_document import ResumeDocument
+from resume_parser import ResumeParser
+
+SECTION = """Senior Software Engineer - Example Corp (2019 - Present)
+- Led a team of five engineers migrating services to Kubernetes on AWS.
+- Built ETL pipelines in Python with pandas and scikit-learn models.
+- Worked with Django, Flask, PostgreSQL and Redis on customer facing APIs.
+"""
+
+RESUME = """Jane Doe
+jane.doe@example.com | (555) 123-4567
+
+Work Experience
+""" + SECTION * 40 + """
+Education
+Bachelor of Science in Computer Science, Example University
+
+Skills
+Python, Django, Flask, PostgreSQL, Docker, Kubernetes, AWS, leadership
+"""
+
+
+EXTRACTORS = ['extract_email', 'extract_phone', 'extract_skills', 'extract_education', 'extract_experience']
+
+
+def per_extractor(parser, text, step=None):
+    for name in EXTRACTORS:
+        (step or call)(getattr(parser, name), text)
+
+
+def shared(parser, text, step=None):
+    document = ResumeDocument(text)
+    for name in EXTRACTORS:
+        (step or call)(getattr(parser, name), document)
+
+
+def call(extractor, argument):
+    extractor(argument)
+
+
+def measure(func, parser, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(parser, text)
+    elapsed_us = (time.perf_counter() - start) / repeat * 1e6
+
+    # Sum each extractor's peak allocation so text copies made by every
+    # extractor are counted, not just the largest one
+    allocated = 0
+
+    def traced_step(extractor, argument):
+        nonlocal allocated
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        extractor(argument)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - before
+
+    tracemalloc.start()
+    func(parser, text, traced_step)
+    tracemalloc.stop()
+    return elapsed_us, allocated
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    parser = ResumeParser()
+
+    print(f"Resume length: {len(RESUME)} chars, {repeat} iterations")
+    print(f"{'path':<16} {'time (us)':>10} {'allocated (KB)':>16}")
+    for label, func in [('per extractor', per_extractor), ('shared', shared)]:
+        elapsed_us, peak = measure(func, parser, RESUME, repeat)
+        print(f"{label:<16} {elapsed_us:>10.1f} {peak / 1024:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
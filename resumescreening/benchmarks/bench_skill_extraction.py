@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark skill extraction as the skills taxonomy grows.
+
+Compares the original per-skill substring scan against the single-pass
+SkillExtractor, after checking that the extractor still finds versioned,
+'js'-suffixed and domain spellings and does not match short skills inside
+other words. Run from the resumescreening directory:
+
+    python benchmarks/bench_skill_extraction.py
+"""
+
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_extractor import SkillExtractor
+
+BASE_SKILLS = [
+    'python', 'java', 'javascript', 'c++', 'c#', 'go', 'r', 'react', 'react native',
+    'node.js', 'django', 'flask', 'sql server', 'postgresql', 'aws', 'docker',
+    'kubernetes', 'scikit-learn', 'pandas', 'gitlab ci', 'leadership', 'problem solving'
+]
+
+SAMPLE_RESUME = """
+Jane Doe
+jane.doe@example.com | (555) 123-4567
+
+Summary
+Backend engineer with 6 years of experience building data platforms in Python and Go.
+
+Skills
+Python, Django, Flask, PostgreSQL, SQL Server, Docker, Kubernetes, AWS, React Native,
+scikit-learn, pandas, GitLab CI, leadership, problem solving
+
+Experience
+Senior Software Engineer - Example Corp (2019 - Present)
+- Led a team of five engineers migrating services to Kubernetes on AWS.
+- Built ETL pipelines in Python with pandas and scikit-learn models.
+
+Education
+Bachelor of Science in Computer Science, Example University
+"""
+
+
+# (text, skills the extractor must find, skills it must not find)
+SPELLING_CASES = [
+    ('HTML5, CSS3, ReactJS, Python3, github.com/jdoe', {'html', 'css', 'react', 'python', 'github'}, set()),
+    ('Node.js, NodeJS, Vue.js, C++17, python3.10', {'node.js', 'vue', 'c++', 'python'}, set()),
+    ('Go and R; gopher, erlang, cargo, json', {'go', 'r'}, {'rust', 'javascript'}),
+]
+
+
+def check_spellings():
+    """Return the spelling cases the parser's extractor gets wrong"""
+    from resume_parser import ResumeParser
+
+    extractor = ResumeParser().skill_extractor
+    failures = []
+    for text, expected, unexpected in SPELLING_CASES:
+        found = extractor.extract(text.lower())
+        if not expected <= found or found & unexpected:
+            failures.append((text, sorted(expected - found), sorted(found & unexpected)))
+    return failures
+
+
+def synthetic_taxonomy(size, seed=42):
+    """Pad the base skills with random one and two word skill names"""
+    rng = random.Random(seed)
+    skills = list(BASE_SKILLS)
+    while len(skills) < size:
+        words = rng.choice([1, 1, 2])
+        skills.append(' '.join(
+            ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+            for _ in range(words)
+        ))
+    return skills
+
+
+def substring_scan(skills, text):
+    """The original extract_skills loop"""
+    found = set()
+    text_lower = text.lower()
+    for skill in skills:
+        if skill.lower() in text_lower:
+            found.add(skill.lower())
+    return found
+
+
+def time_per_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    failures = check_spellings()
+    for text, missing, extra in failures:
+        print(f"✗ {text!r}: missing {missing}, unexpected {extra}")
+    if failures:
+        sys.exit(1)
+    print(f"✓ {len(SPELLING_CASES)} spelling cases extracted as expected\n")
+
+    text = (SAMPLE_RESUME * 3).lower()
+    repeat = 200
+
+    print(f"Resume length: {len(text)} chars, {repeat} iterations per row")
+    print(f"{'skills':>8} {'substring (us)':>16} {'extractor (us)':>16}")
+
+    for size in [120, 1000, 5000, 20000]:
+        skills = synthetic_taxonomy(size)
+        extractor = SkillExtractor(skills)
+
+        substring_us = time_per_call(lambda: substring_scan(skills, text), repeat)
+        extractor_us = time_per_call(lambda: extractor.extract(text), repeat)
+
+        print(f"{size:>8} {substring_us:>16.1f} {extractor_us:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for SkillIndex bitsets against the set-based scoring path.
+
+For the same synthetic candidates and requirements, times:
+  - intersection size: len(set & set) against popcount(bits & bits)
+  - exact match, coverage and weighted category scores: the set-based
+    calculate_* methods against the bitset path used by match_skills,
+    with candidate bitsets built on the fly and prebuilt
+  - matched counts for the whole pool: a Python loop over sets against
+    one popcount over the packed uint64 matrix
+
+Run from the resumescreening directory:
+
+    python benchmarks/bench_skill_index.py [num_candidates]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from skill_index import popcount
+from skill_matcher import SkillMatcher
+
+REQUIREMENTS = """Backend engineer with Python, Django, Flask and PostgreSQL.
+AWS, Docker, Kubernetes and Terraform; Git and Jenkins. React is a plus.
+Agile, scrum; strong communication, leadership and teamwork."""
+
+
+def make_pool(matcher, size=300, seed=0):
+    """A vocabulary of taxonomy-like skills plus filler skills"""
+    rng = random.Random(seed)
+    taxonomy = [
+        'python', 'java', 'javascript', 'react', 'django', 'flask', 'postgresql',
+        'mysql', 'aws', 'docker', 'kubernetes', 'terraform', 'git', 'jenkins',
+        'agile', 'scrum', 'communication', 'leadership', 'teamwork', 'figma',
+    ]
+    filler = [f"skill{i}" for i in range(size - len(taxonomy))]
+    pool = matcher.normalize_skills(taxonomy + filler)
+    rng.shuffle(pool)
+    return pool
+
+
+def bench(label, func, repeat, items=1):
+    """Print the average time of func per call, divided by items"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed * 1e6 / (repeat * items):10.2f} µs")
+
+
+def pack(bitsets, num_words):
+    """Pack Python int bitsets into an (n, num_words) uint64 matrix"""
+    width = num_words * 8
+    limit = (1 << (num_words * 64)) - 1
+    data = b''.join((bits & limit).to_bytes(width, 'little') for bits in bitsets)
+    return np.frombuffer(data, dtype='<u8').reshape(-1, num_words)
+
+
+def popcount_rows(packed):
+    """Set bits per row of a packed uint64 bitset matrix"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(packed).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(packed.view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def main():
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(1)
+
+    matcher = SkillMatcher()
+    plan = matcher.compile_requirements(REQUIREMENTS)
+    pool = make_pool(matcher)
+    candidates = [rng.sample(pool, rng.randint(5, 40)) for _ in range(num_candidates)]
+    candidate_sets = [set(skills) for skills in candidates]
+    candidate_bits = [matcher.skill_index.to_bits(skills) for skills in candidates]
+    required_set = set(plan.required_skills)
+    required_size = len(plan.required_set)
+    index = matcher.skill_index
+
+    print(f"candidates: {num_candidates}, vocabulary: {len(index)} skills, required: {required_size}")
+    print("\nPer candidate:")
+
+    def per_candidate(func):
+        def run():
+            for i in range(num_candidates):
+                func(i)
+        return run
+
+    def set_intersection(i):
+        return len(candidate_sets[i] & required_set)
+
+    def bits_intersection(i):
+        return popcount(candidate_bits[i] & plan.required_bits)
+
+    def set_scores(i):
+        skills = candidates[i]
+        return (
+            matcher.calculate_exact_match_score(skills, plan.required_skills),
+            matcher.calculate_skill_coverage(skills, plan.required_skills),
+            matcher.calculate_weighted_score(skills, plan.required_skills, plan.categories)
+        )
+
+    def bitset_scores(bits):
+        matched = popcount(bits & plan.required_bits)
+        return (
+            matcher._f1_from_counts(matched, popcount(bits), required_size),
+            matched / required_size,
+            matcher._weighted_score_from_bits(bits, plan)
+        )
+
+    def bits_scores_built(i):
+        return bitset_scores(index.to_bits(candidates[i]))
+
+    def bits_scores_prebuilt(i):
+        return bitset_scores(candidate_bits[i])
+
+    cases = [
+        ("intersection size, sets", set_intersection),
+        ("intersection size, bitsets", bits_intersection),
+        ("exact + coverage + weighted, sets", set_scores),
+        ("exact + coverage + weighted, bitsets built", bits_scores_built),
+        ("exact + coverage + weighted, bitsets stored", bits_scores_prebuilt),
+    ]
+    for label, func in cases:
+        bench(label, per_candidate(func), 3, num_candidates)
+
+    print("\nWhole pool per call:")
+    num_words = max(1, (len(index) + 63) // 64)
+    packed = pack(candidate_bits, num_words)
+    required_packed = pack([plan.required_bits], num_words)
+    bench("matched counts, loop over sets", lambda: [len(s & required_set) for s in candidate_sets], 5)
+    bench("matched counts, packed popcount", lambda: popcount_rows(packed & required_packed), 5)
+
+
+if __name__ == '__main__':
+    main()
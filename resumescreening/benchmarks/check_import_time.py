@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Enforce a cold-start budget for `import app`.
+
+Runs `python -X importtime -c "import app"` in a fresh interpreter, reports
+the slowest imports and exits non-zero if the cumulative import time goes
+over budget or a heavy dependency is imported eagerly. Modules import
+SpaCy, NLTK, scikit-learn, NumPy/SciPy, PyPDF2 and python-docx inside the
+functions that use them (or in a warmup method), never at module level, so
+that `import app` stays cheap. Run from the resumescreening directory:
+
+    python benchmarks/check_import_time.py [budget_ms]
+"""
+
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS = 1000
+
+# Packages that must only load on first use or in warmup()
+LAZY_PACKAGES = ['spacy', 'nltk', 'sklearn', 'PyPDF2', 'docx']
+
+
+def parse_importtime(stderr):
+    """Return {module: cumulative_us} from -X importtime output"""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, module = line.split('|', 2)
+        timings[module.strip()] = int(cumulative_us.strip())
+    return timings
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        print("✗ import app failed")
+        sys.exit(1)
+
+    timings = parse_importtime(result.stderr)
+    total_ms = timings.get('app', 0) / 1000
+
+    print("Slowest imports (cumulative):")
+    for module, cumulative_us in sorted(timings.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    failed = False
+
+    eager = [package for package in LAZY_PACKAGES if package in timings]
+    if eager:
+        print(f"✗ Heavy dependencies imported eagerly: {', '.join(eager)}")
+        failed = True
+
+    if total_ms > budget_ms:
+        print(f"✗ import app took {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+        failed = True
+    else:
+        print(f"✓ import app took {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Check CandidateRanker.top_k against a brute-force ranking.
+
+Fills a temporary database with small hand-picked cases (e.g. a candidate
+whose skills only form a requirement bigram when joined) and random
+candidates drawn from the skills taxonomy plus multi-word combinations of
+it, then for several requirement texts and values of k compares top_k with
+scoring every candidate through match_skills and sorting. The ranker scores
+one candidate per batch, so every upper bound it prunes with is put to the
+test. Exits non-zero on the first difference. Run from the resumescreening
+directory:
+
+    python benchmarks/check_rank.py [num_candidates]
+"""
+
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Database
+from ranker import CandidateRanker
+from resume_parser import ResumeParser
+from skill_matcher import SkillMatcher
+
+# Skill lists stored before the random ones, so they get the lowest ids
+HAND_PICKED = [
+    # Only the first has 'python django' as one skill, but the second
+    # forms the bigram too when its skills are joined, and scores higher
+    ['python', 'django', 'python django'],
+    ['python', 'django'],
+    ['django', 'python'],
+    ['react native', 'flutter'],
+    ['react', 'native apps', 'flutter'],
+    ['machine learning', 'python'],
+    ['figma'],
+]
+
+REQUIREMENTS = [
+    "Python and Django",
+    "Senior backend engineer: Python, Django, PostgreSQL, Redis, AWS, Docker and Kubernetes. Leadership.",
+    "Frontend developer with JavaScript, React, Angular, HTML and CSS; Figma and Jest. Teamwork.",
+    "Mobile engineer: Swift, Kotlin, Flutter and React Native.",
+    "Data scientist: Python, pandas, numpy, TensorFlow, PyTorch, Spark and SQL Server.",
+]
+
+
+def make_skill_lists(num_candidates, seed=0):
+    rng = random.Random(seed)
+    taxonomy = sorted({skill for skills in ResumeParser().skills_db.values() for skill in skills})
+    skill_lists = [list(skills) for skills in HAND_PICKED]
+    for _ in range(num_candidates):
+        skills = rng.sample(taxonomy, rng.randint(1, 8))
+        # Multi-word skills put words next to each other that the
+        # requirements may also pair up
+        for _ in range(rng.randint(0, 2)):
+            skills.append(' '.join(rng.sample(taxonomy, 2)))
+        skill_lists.append(skills)
+    return skill_lists
+
+
+def brute_force(db, matcher, requirements, k):
+    """Best k (candidate_id, score) by scoring everyone with match_skills"""
+    plan = matcher.compile_requirements(requirements)
+    scored = [
+        (candidate['id'], matcher.match_skills(candidate['skills'], plan)[0])
+        for candidate in db.get_all_candidates()
+    ]
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:k]
+
+
+def main():
+    num_candidates = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as directory:
+        matcher = SkillMatcher(similarity_model_path=None)
+        db = Database(os.path.join(directory, 'check_rank.db'), skill_normalizer=matcher.normalize_skills)
+        skill_lists = make_skill_lists(num_candidates)
+        for i, skills in enumerate(skill_lists):
+            db.save_candidate({
+                'name': f"Candidate {i}", 'email': '', 'phone': '', 'skills': skills,
+                'experience': [], 'education': [], 'match_score': 0.0,
+                'matched_skills': [], 'missing_skills': [], 'interview_recommendations': [],
+                'resume_file': '', 'upload_date': '',
+                'category_breakdown': matcher.category_breakdown(skills)
+            })
+
+        # Fit on the candidates too, so the vocabulary has their bigrams
+        model_path = os.path.join(directory, 'similarity_model.pkl')
+        matcher.fit_similarity_model(skill_lists).save(model_path)
+        matcher.similarity_model_path = model_path
+        matcher.reload_similarity_model()
+        ranker = CandidateRanker(db, matcher, batch_size=1)
+
+        checks = 0
+        for requirements in REQUIREMENTS:
+            for k in (1, 3, 10, 50):
+                expected = brute_force(db, matcher, requirements, k)
+                ranked, _ = ranker.top_k(requirements, k)
+                got = [(candidate['id'], score) for candidate, score, _, _ in ranked]
+                same = len(got) == len(expected) and all(
+                    got_id == expected_id and abs(got_score - expected_score) < 1e-9
+                    for (got_id, got_score), (expected_id, expected_score) in zip(got, expected)
+                )
+                if not same:
+                    print(f"✗ {requirements!r}, k={k}")
+                    print(f"  top_k:       {got}")
+                    print(f"  brute force: {expected}")
+                    sys.exit(1)
+                checks += 1
+
+    print(f"✓ top_k matched the brute-force ranking in {checks} checks "
+          f"({len(skill_lists)} candidates, {len(REQUIREMENTS)} requirement texts)")
+
+
+if __name__ == '__main__':
+    main()
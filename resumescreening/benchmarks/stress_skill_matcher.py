@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Stress a shared SkillMatcher from many threads against a serial baseline.
+
+Builds a pool of random (candidate skills, requirements) cases, scores them
+serially on one matcher, then scores them again from a thread pool on a
+single fresh matcher shared by every thread, so the lazy model load is also
+contended. While the threads run, another thread keeps swapping the current
+requirements plan and reloading the similarity model. Every threaded result
+(score, matched and missing skills) must equal its serial counterpart; the
+script exits non-zero on the first mismatch. Run from the resumescreening
+directory:
+
+    python benchmarks/stress_skill_matcher.py [num_matches] [threads]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_matcher import SkillMatcher
+
+SKILL_POOL = [
+    'python', 'java', 'javascript', 'js', 'react', 'react.js', 'node.js', 'c++',
+    'c#', 'aws', 'docker', 'kubernetes', 'sql server', 'postgresql', 'mongodb',
+    'machine learning', 'pandas', 'django', 'flask', 'git', 'agile', 'scrum',
+    'leadership', 'communication', 'teamwork', 'figma', 'terraform', 'jira',
+]
+
+REQUIREMENTS = [
+    "Backend engineer: Python, Django, PostgreSQL, AWS, Docker and Kubernetes.",
+    "Frontend developer with JavaScript, React and Figma; agile and scrum teams.",
+    "Java and C++ engineer, Git, Jenkins, strong communication and leadership.",
+    "Data scientist: Python, pandas, machine learning, SQL Server, teamwork.",
+    "DevOps: Terraform, Kubernetes, Docker, AWS, GitLab, problem solving.",
+]
+
+BATCH_SIZE = 25
+
+
+def make_cases(num_matches, seed=0):
+    rng = random.Random(seed)
+    return [
+        (rng.sample(SKILL_POOL, rng.randint(0, 12)), rng.choice(REQUIREMENTS))
+        for _ in range(num_matches)
+    ]
+
+
+def normalize(result):
+    """Order-independent form of a match_skills result"""
+    score, matched, missing = result
+    return score, sorted(matched), sorted(missing)
+
+
+def churn(matcher, stop):
+    """Swap the current plan and reload the model until stop is set"""
+    swaps = 0
+    while not stop.is_set():
+        matcher.update_requirements(REQUIREMENTS[swaps % len(REQUIREMENTS)])
+        if swaps % 50 == 0:
+            matcher.reload_similarity_model()
+        swaps += 1
+    return swaps
+
+
+def main():
+    num_matches = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    cases = make_cases(num_matches)
+
+    start = time.perf_counter()
+    baseline_matcher = SkillMatcher()
+    baseline = [normalize(baseline_matcher.match_skills(skills, requirements)) for skills, requirements in cases]
+    serial_seconds = time.perf_counter() - start
+
+    # Batched baseline for match_many, one batch per requirements text
+    batches = [
+        (start_index, cases[start_index][1], [skills for skills, _ in cases[start_index:start_index + BATCH_SIZE]])
+        for start_index in range(0, num_matches, BATCH_SIZE)
+    ]
+
+    shared = SkillMatcher()
+    stop = threading.Event()
+    churn_result = []
+    churn_thread = threading.Thread(target=lambda: churn_result.append(churn(shared, stop)))
+    churn_thread.start()
+
+    def match_one(index):
+        skills, requirements = cases[index]
+        return index, normalize(shared.match_skills(skills, requirements))
+
+    def match_batch(batch):
+        start_index, requirements, skill_lists = batch
+        return start_index, requirements, [normalize(result) for result in shared.match_many(skill_lists, requirements)]
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            single_results = list(executor.map(match_one, range(num_matches)))
+            batch_results = list(executor.map(match_batch, batches))
+    finally:
+        stop.set()
+        churn_thread.join()
+    threaded_seconds = time.perf_counter() - start
+
+    mismatches = 0
+    for index, result in single_results:
+        if result != baseline[index]:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"✗ match_skills case {index}: {result} != {baseline[index]}")
+
+    for start_index, requirements, results in batch_results:
+        for offset, result in enumerate(results):
+            skills = cases[start_index + offset][0]
+            expected = normalize(baseline_matcher.match_skills(skills, requirements))
+            if abs(result[0] - expected[0]) > 1e-9 or result[1:] != expected[1:]:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"✗ match_many case {start_index + offset}: {result} != {expected}")
+
+    print(f"matches:          {num_matches} single + {num_matches} batched on {threads} threads")
+    print(f"plan swaps:       {churn_result[0] if churn_result else 0}")
+    print(f"serial baseline:  {serial_seconds:.2f}s")
+    print(f"threaded run:     {threaded_seconds:.2f}s")
+
+    if mismatches:
+        print(f"✗ {mismatches} results differ from the serial baseline")
+        sys.exit(1)
+    print("✓ All threaded results match the serial baseline")
+
+
+if __name__ == '__main__':
+    main()
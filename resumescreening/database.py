@@ -1,13 +1,26 @@
 import sqlite3
 import json
+import zlib
 from datetime import datetime
 import os
 
 class Database:
-    def __init__(self, db_path='resume_screening.db'):
+    def __init__(self, db_path='resume_screening.db', skill_normalizer=None):
         self.db_path = db_path
+        # Normalizes skills for the candidate_skills index; must be the
+        # normalize_skills of the SkillMatcher used for scoring (a default
+        # SkillMatcher's when not given)
+        self._skill_normalizer = skill_normalizer
         self.init_database()
 
+    @property
+    def skill_normalizer(self):
+        """Skill normalization used by the inverted skill index"""
+        if self._skill_normalizer is None:
+            from skill_matcher import SkillMatcher
+            self._skill_normalizer = SkillMatcher().normalize_skills
+        return self._skill_normalizer
+
     def get_connection(self):
         """Get database connection"""
         conn = sqlite3.connect(self.db_path)
@@ -35,10 +48,63 @@ class Database:
                 interview_recommendations TEXT,  -- JSON object
                 resume_file TEXT,
                 upload_date TEXT,
+                parser_version TEXT,  -- ResumeParser PARSER_VERSION that produced the row
+                category_breakdown TEXT,  -- JSON object: category -> normalized skills
+                skill_count INTEGER,  -- Number of normalized skills, as SkillMatcher counts them
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
+        # Databases created before parser_version, category_breakdown or
+        # skill_count existed get the columns added
+        cursor.execute('PRAGMA table_info(candidates)')
+        columns = [row['name'] for row in cursor.fetchall()]
+        if 'parser_version' not in columns:
+            cursor.execute('ALTER TABLE candidates ADD COLUMN parser_version TEXT')
+        if 'category_breakdown' not in columns:
+            cursor.execute('ALTER TABLE candidates ADD COLUMN category_breakdown TEXT')
+        if 'skill_count' not in columns:
+            cursor.execute('ALTER TABLE candidates ADD COLUMN skill_count INTEGER')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidates_parser_version ON candidates (parser_version)')
+        
+        # Create candidate_texts table: full extracted resume text, compressed,
+        # kept apart from candidates so listing candidates never loads it
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS candidate_texts (
+                candidate_id INTEGER PRIMARY KEY,
+                compressed_text BLOB NOT NULL,
+                compression TEXT NOT NULL DEFAULT 'zlib',
+                text_length INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (candidate_id) REFERENCES candidates (id)
+            )
+        ''')
+        
+        # Inverted skill index: every distinct normalized skill, and which
+        # candidates have it, kept in step with candidates.skills
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'candidate_skills'")
+        build_skill_index = cursor.fetchone() is None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS skills (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE
+            )
+        ''')
+        
+        # Keyed by skill first for "who has these skills" lookups; the
+        # candidate_id index serves deletes and per-candidate updates
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS candidate_skills (
+                skill_id INTEGER NOT NULL,
+                candidate_id INTEGER NOT NULL,
+                PRIMARY KEY (skill_id, candidate_id),
+                FOREIGN KEY (skill_id) REFERENCES skills (id),
+                FOREIGN KEY (candidate_id) REFERENCES candidates (id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidate_skills_candidate ON candidate_skills (candidate_id)')
+        
         # Create job_requirements table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS job_requirements (
@@ -49,6 +115,34 @@ class Database:
             )
         ''')
         
+        # Open roles screened side by side; job_requirements keeps the
+        # single current requirements text
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                requirements TEXT NOT NULL,
+                status TEXT DEFAULT 'open',  -- Only open jobs are scored and suggested
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Score of every candidate against every open job. Keyed by candidate
+        # for "best jobs for this candidate"; the job index serves per-job
+        # rankings and deletes
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS candidate_job_scores (
+                candidate_id INTEGER NOT NULL,
+                job_id INTEGER NOT NULL,
+                score REAL NOT NULL,
+                PRIMARY KEY (candidate_id, job_id),
+                FOREIGN KEY (candidate_id) REFERENCES candidates (id),
+                FOREIGN KEY (job_id) REFERENCES jobs (id)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_candidate_job_scores_job ON candidate_job_scores (job_id, score DESC)')
+        
         # Create interview_sessions table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS interview_sessions (
@@ -66,6 +160,10 @@ class Database:
         
         conn.commit()
         conn.close()
+        
+        # Index candidates stored before the skill index existed
+        if build_skill_index:
+            self.rebuild_skill_index()
 
     def save_candidate(self, candidate_data):
         """Save candidate data to database"""
@@ -77,8 +175,9 @@ class Database:
                 INSERT INTO candidates (
                     name, email, phone, skills, experience, education,
                     match_score, matched_skills, missing_skills,
-                    interview_recommendations, resume_file, upload_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    interview_recommendations, resume_file, upload_date, parser_version,
+                    category_breakdown
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 candidate_data['name'],
                 candidate_data['email'],
@@ -91,10 +190,13 @@ class Database:
                 json.dumps(candidate_data['missing_skills']),
                 json.dumps(candidate_data['interview_recommendations']),
                 candidate_data['resume_file'],
-                candidate_data['upload_date']
+                candidate_data['upload_date'],
+                candidate_data.get('parser_version'),
+                self._dumps_optional(candidate_data.get('category_breakdown'))
             ))
             
             candidate_id = cursor.lastrowid
+            self._index_candidate_skills(cursor, candidate_id, candidate_data['skills'])
             conn.commit()
             return candidate_id
             
@@ -171,6 +273,469 @@ class Database:
         finally:
             conn.close()
 
+    def update_candidate_scores(self, updates):
+        """Update match scores for many candidates in a single transaction.
+        
+        updates is an iterable of (candidate_id, match_score, matched_skills,
+        missing_skills).
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany('''
+                UPDATE candidates
+                SET match_score = ?, matched_skills = ?, missing_skills = ?
+                WHERE id = ?
+            ''', [
+                (match_score, json.dumps(matched_skills), json.dumps(missing_skills), candidate_id)
+                for candidate_id, match_score, matched_skills, missing_skills in updates
+            ])
+            
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error updating candidate scores: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def update_candidate_fields(self, updates, parser_version=None):
+        """Update extracted skills, education and experience for many candidates.
+        
+        updates is an iterable of (candidate_id, skills, education, experience,
+        category_breakdown) and is written in a single transaction, stamping
+        each row with parser_version.
+        """
+        updates = list(updates)
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany('''
+                UPDATE candidates
+                SET skills = ?, education = ?, experience = ?, category_breakdown = ?, parser_version = ?
+                WHERE id = ?
+            ''', [
+                (json.dumps(skills), json.dumps(education), json.dumps(experience),
+                 self._dumps_optional(category_breakdown), parser_version, candidate_id)
+                for candidate_id, skills, education, experience, category_breakdown in updates
+            ])
+            for candidate_id, skills, _, _, _ in updates:
+                self._index_candidate_skills(cursor, candidate_id, skills)
+            
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error updating candidate fields: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def save_candidate_text(self, candidate_id, text):
+        """Store the full extracted resume text, zlib-compressed"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO candidate_texts (
+                    candidate_id, compressed_text, compression, text_length
+                ) VALUES (?, ?, 'zlib', ?)
+            ''', (candidate_id, zlib.compress(text.encode('utf-8')), len(text)))
+            
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error saving candidate text: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def get_candidate_text(self, candidate_id):
+        """Get the full extracted resume text for a candidate, or None"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(
+                'SELECT compressed_text FROM candidate_texts WHERE candidate_id = ?',
+                (candidate_id,)
+            )
+            row = cursor.fetchone()
+            
+            if row:
+                return self.decompress_text(row['compressed_text'])
+            return None
+            
+        except Exception as e:
+            print(f"Error getting candidate text: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def iter_candidate_texts(self, chunk_size=500, stale_for_version=None):
+        """Yield lists of (candidate_id, compressed_text) for stored texts.
+        
+        With stale_for_version, only candidates produced by another (or no
+        recorded) parser version are returned. Texts stay compressed so
+        chunks can be handed to worker processes cheaply; decompress them
+        with decompress_text.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            last_id = 0
+            while True:
+                if stale_for_version is None:
+                    cursor.execute('''
+                        SELECT candidate_id, compressed_text FROM candidate_texts
+                        WHERE candidate_id > ?
+                        ORDER BY candidate_id
+                        LIMIT ?
+                    ''', (last_id, chunk_size))
+                else:
+                    cursor.execute('''
+                        SELECT t.candidate_id, t.compressed_text
+                        FROM candidate_texts t JOIN candidates c ON c.id = t.candidate_id
+                        WHERE t.candidate_id > ?
+                          AND (c.parser_version IS NULL OR c.parser_version != ?)
+                        ORDER BY t.candidate_id
+                        LIMIT ?
+                    ''', (last_id, stale_for_version, chunk_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                
+                yield [(row['candidate_id'], row['compressed_text']) for row in rows]
+                last_id = rows[-1]['candidate_id']
+        finally:
+            conn.close()
+
+    def iter_candidate_skills(self, chunk_size=500):
+        """Yield lists of (candidate_id, skills) for every candidate"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            last_id = 0
+            while True:
+                cursor.execute('''
+                    SELECT id, skills FROM candidates
+                    WHERE id > ?
+                    ORDER BY id
+                    LIMIT ?
+                ''', (last_id, chunk_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                
+                yield [(row['id'], json.loads(row['skills']) if row['skills'] else []) for row in rows]
+                last_id = rows[-1]['id']
+        finally:
+            conn.close()
+
+    def _skill_ids(self, cursor, skills, create=False):
+        """Ids of already normalized skill names, adding missing ones with create"""
+        names = json.dumps(list(dict.fromkeys(skills)))
+        if create:
+            cursor.execute('''
+                INSERT OR IGNORE INTO skills (name) SELECT value FROM json_each(?)
+            ''', (names,))
+        cursor.execute('SELECT id FROM skills WHERE name IN (SELECT value FROM json_each(?))', (names,))
+        return [row['id'] for row in cursor.fetchall()]
+
+    def _index_candidate_skills(self, cursor, candidate_id, skills):
+        """Replace a candidate's candidate_skills rows and skill_count"""
+        normalized = self.skill_normalizer(skills)
+        cursor.execute('DELETE FROM candidate_skills WHERE candidate_id = ?', (candidate_id,))
+        cursor.executemany(
+            'INSERT INTO candidate_skills (skill_id, candidate_id) VALUES (?, ?)',
+            [(skill_id, candidate_id) for skill_id in self._skill_ids(cursor, normalized, create=True)]
+        )
+        cursor.execute('UPDATE candidates SET skill_count = ? WHERE id = ?', (len(normalized), candidate_id))
+
+    def rebuild_skill_index(self, chunk_size=500):
+        """Re-index every candidate's skills, e.g. after a normalization change"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            indexed = 0
+            for rows in self.iter_candidate_skills(chunk_size):
+                for candidate_id, skills in rows:
+                    self._index_candidate_skills(cursor, candidate_id, skills)
+                conn.commit()
+                indexed += len(rows)
+            return indexed
+            
+        except Exception as e:
+            print(f"Error rebuilding skill index: {e}")
+            conn.rollback()
+            return 0
+        finally:
+            conn.close()
+
+    def get_skill_vocabulary(self):
+        """Every normalized skill name in the skill index"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT name FROM skills ORDER BY id')
+            return [row['name'] for row in cursor.fetchall()]
+            
+        except Exception as e:
+            print(f"Error getting skill vocabulary: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def _skill_filter(self, skills, match):
+        """SQL selecting ids of candidates with any/all of skills, and its parameters"""
+        if match not in ('any', 'all'):
+            raise ValueError(f"match must be 'any' or 'all', not {match!r}")
+        
+        names = list(dict.fromkeys(self.skill_normalizer(skills)))
+        sql = '''
+            SELECT cs.candidate_id FROM candidate_skills cs
+            WHERE cs.skill_id IN (
+                SELECT id FROM skills WHERE name IN (SELECT value FROM json_each(?))
+            )
+        '''
+        params = [json.dumps(names)]
+        if match == 'all':
+            sql += ' GROUP BY cs.candidate_id HAVING COUNT(*) = ?'
+            params.append(len(names))
+        return sql, params
+
+    def get_candidate_ids_with_skills(self, skills, match='any'):
+        """Ids of candidates having any (or, with match='all', every) of skills"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            sql, params = self._skill_filter(skills, match)
+            cursor.execute(f'SELECT DISTINCT candidate_id FROM ({sql}) ORDER BY candidate_id', params)
+            return [row['candidate_id'] for row in cursor.fetchall()]
+            
+        except Exception as e:
+            print(f"Error getting candidates by skills: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def get_candidates_with_skills(self, skills, match='any'):
+        """Candidates having any (or, with match='all', every) of skills, by match score"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            sql, params = self._skill_filter(skills, match)
+            cursor.execute(f'''
+                SELECT * FROM candidates
+                WHERE id IN ({sql})
+                ORDER BY match_score DESC, created_at DESC
+            ''', params)
+            
+            rows = cursor.fetchall()
+            return [self._row_to_dict(row) for row in rows]
+            
+        except Exception as e:
+            print(f"Error getting candidates by skills: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def get_unmatched_skill_counts(self, skills):
+        """Distinct skill_count values of candidates having none of skills"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            sql, params = self._skill_filter(skills, 'any')
+            cursor.execute(f'''
+                SELECT DISTINCT COALESCE(skill_count, 0) AS skill_count FROM candidates
+                WHERE id NOT IN ({sql})
+            ''', params)
+            return [row['skill_count'] for row in cursor.fetchall()]
+            
+        except Exception as e:
+            print(f"Error getting unmatched skill counts: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def update_unmatched_candidate_scores(self, skills, scores_by_skill_count, missing_skills):
+        """Score every candidate having none of skills in one transaction.
+        
+        Such candidates match nothing, so they all get an empty matched list,
+        the same missing list and a score that depends only on their
+        skill_count, looked up in scores_by_skill_count.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            sql, params = self._skill_filter(skills, 'any')
+            cursor.executemany(f'''
+                UPDATE candidates
+                SET match_score = ?, matched_skills = '[]', missing_skills = ?
+                WHERE COALESCE(skill_count, 0) = ? AND id NOT IN ({sql})
+            ''', [
+                (score, json.dumps(missing_skills), skill_count, *params)
+                for skill_count, score in scores_by_skill_count.items()
+            ])
+            
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error updating unmatched candidate scores: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def get_skill_overlap(self, skills):
+        """Which of skills each candidate has, for candidates having any.
+        
+        Returns (candidate_id, skill_count, distinct_skills, shared_skills)
+        rows: skill_count as stored, distinct_skills the number of distinct
+        normalized skills and shared_skills the names of skills the
+        candidate has. Reads only the index, never the skills columns.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            names = list(dict.fromkeys(self.skill_normalizer(skills)))
+            cursor.execute('''
+                SELECT c.id AS candidate_id,
+                       COALESCE(c.skill_count, 0) AS skill_count,
+                       (SELECT COUNT(*) FROM candidate_skills a WHERE a.candidate_id = c.id) AS distinct_skills,
+                       json_group_array(s.name) AS shared_skills
+                FROM skills s
+                JOIN candidate_skills cs ON cs.skill_id = s.id
+                JOIN candidates c ON c.id = cs.candidate_id
+                WHERE s.name IN (SELECT value FROM json_each(?))
+                GROUP BY c.id
+            ''', (json.dumps(names),))
+            return [
+                (row['candidate_id'], row['skill_count'], row['distinct_skills'], json.loads(row['shared_skills']))
+                for row in cursor.fetchall()
+            ]
+            
+        except Exception as e:
+            print(f"Error getting skill overlap: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def get_candidate_skill_rows(self, candidate_ids):
+        """(candidate_id, skills, category_breakdown) for the given candidates, in that order"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT id, skills, category_breakdown FROM candidates
+                WHERE id IN (SELECT value FROM json_each(?))
+            ''', (json.dumps(list(candidate_ids)),))
+            rows = {}
+            for row in cursor.fetchall():
+                rows[row['id']] = (
+                    row['id'],
+                    json.loads(row['skills']) if row['skills'] else [],
+                    json.loads(row['category_breakdown']) if row['category_breakdown'] else None
+                )
+            return [rows[candidate_id] for candidate_id in candidate_ids if candidate_id in rows]
+            
+        except Exception as e:
+            print(f"Error getting candidate skills: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def get_unmatched_candidate_ids(self, skills, skill_counts, limit):
+        """Lowest ids of candidates having none of skills and one of skill_counts"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            sql, params = self._skill_filter(skills, 'any')
+            cursor.execute(f'''
+                SELECT id FROM candidates
+                WHERE COALESCE(skill_count, 0) IN (SELECT value FROM json_each(?))
+                  AND id NOT IN ({sql})
+                ORDER BY id
+                LIMIT ?
+            ''', [json.dumps(list(skill_counts)), *params, limit])
+            return [row['id'] for row in cursor.fetchall()]
+            
+        except Exception as e:
+            print(f"Error getting unmatched candidates: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def get_candidates_by_ids(self, candidate_ids):
+        """Candidates with the given ids, in that order"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(
+                'SELECT * FROM candidates WHERE id IN (SELECT value FROM json_each(?))',
+                (json.dumps(list(candidate_ids)),)
+            )
+            candidates = {row['id']: self._row_to_dict(row) for row in cursor.fetchall()}
+            return [candidates[candidate_id] for candidate_id in candidate_ids if candidate_id in candidates]
+            
+        except Exception as e:
+            print(f"Error getting candidates: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def count_stale_candidates(self, parser_version):
+        """Count candidates produced by another parser version.
+        
+        Split into those with stored text, which can be re-derived, and
+        those without, which need a re-upload.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT
+                    COUNT(t.candidate_id) AS reprocessable,
+                    COUNT(*) - COUNT(t.candidate_id) AS missing_text
+                FROM candidates c LEFT JOIN candidate_texts t ON t.candidate_id = c.id
+                WHERE c.parser_version IS NULL OR c.parser_version != ?
+            ''', (parser_version,))
+            row = cursor.fetchone()
+            return {'reprocessable': row['reprocessable'], 'missing_text': row['missing_text']}
+            
+        except Exception as e:
+            print(f"Error counting stale candidates: {e}")
+            return {'reprocessable': 0, 'missing_text': 0}
+        finally:
+            conn.close()
+
+    @staticmethod
+    def decompress_text(compressed_text):
+        """Decompress text stored by save_candidate_text"""
+        return zlib.decompress(compressed_text).decode('utf-8')
+
     def delete_candidate(self, candidate_id):
         """Delete candidate by ID"""
         conn = self.get_connection()
@@ -178,8 +743,12 @@ class Database:
         
         try:
             cursor.execute('DELETE FROM candidates WHERE id = ?', (candidate_id,))
+            deleted = cursor.rowcount > 0
+            cursor.execute('DELETE FROM candidate_texts WHERE candidate_id = ?', (candidate_id,))
+            cursor.execute('DELETE FROM candidate_skills WHERE candidate_id = ?', (candidate_id,))
+            cursor.execute('DELETE FROM candidate_job_scores WHERE candidate_id = ?', (candidate_id,))
             conn.commit()
-            return cursor.rowcount > 0
+            return deleted
             
         except Exception as e:
             print(f"Error deleting candidate: {e}")
@@ -232,6 +801,164 @@ class Database:
         finally:
             conn.close()
 
+    def save_job(self, title, requirements):
+        """Save a new open job; returns its id"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            now = datetime.now().isoformat()
+            cursor.execute('''
+                INSERT INTO jobs (title, requirements, created_at, updated_at)
+                VALUES (?, ?, ?, ?)
+            ''', (title, requirements, now, now))
+            
+            job_id = cursor.lastrowid
+            conn.commit()
+            return job_id
+            
+        except Exception as e:
+            print(f"Error saving job: {e}")
+            conn.rollback()
+            return None
+        finally:
+            conn.close()
+
+    def update_job(self, job_id, title=None, requirements=None, status=None):
+        """Update the given fields of a job.
+        
+        Scores against the old requirements are dropped when requirements
+        change, and scores of a closed job are dropped as well.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                UPDATE jobs
+                SET title = COALESCE(?, title),
+                    requirements = COALESCE(?, requirements),
+                    status = COALESCE(?, status),
+                    updated_at = ?
+                WHERE id = ?
+            ''', (title, requirements, status, datetime.now().isoformat(), job_id))
+            updated = cursor.rowcount > 0
+            if updated and (requirements is not None or status == 'closed'):
+                cursor.execute('DELETE FROM candidate_job_scores WHERE job_id = ?', (job_id,))
+            
+            conn.commit()
+            return updated
+            
+        except Exception as e:
+            print(f"Error updating job: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def get_job(self, job_id):
+        """Get job by ID"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT * FROM jobs WHERE id = ?', (job_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+            
+        except Exception as e:
+            print(f"Error getting job: {e}")
+            return None
+        finally:
+            conn.close()
+
+    def get_jobs(self, status=None):
+        """Get all jobs, or those with the given status, oldest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            if status:
+                cursor.execute('SELECT * FROM jobs WHERE status = ? ORDER BY id', (status,))
+            else:
+                cursor.execute('SELECT * FROM jobs ORDER BY id')
+            
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+            
+        except Exception as e:
+            print(f"Error getting jobs: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def delete_job(self, job_id):
+        """Delete job by ID along with its candidate scores"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('DELETE FROM jobs WHERE id = ?', (job_id,))
+            deleted = cursor.rowcount > 0
+            cursor.execute('DELETE FROM candidate_job_scores WHERE job_id = ?', (job_id,))
+            conn.commit()
+            return deleted
+            
+        except Exception as e:
+            print(f"Error deleting job: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def save_candidate_job_scores(self, scores):
+        """Store many candidate scores in a single transaction.
+        
+        scores is an iterable of (candidate_id, job_id, score); existing
+        scores for the same pairs are replaced.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany('''
+                INSERT OR REPLACE INTO candidate_job_scores (candidate_id, job_id, score)
+                VALUES (?, ?, ?)
+            ''', scores)
+            
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error saving candidate job scores: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def get_best_jobs(self, candidate_id, limit=5):
+        """Open jobs with the candidate's highest scores, best first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT j.*, s.score FROM candidate_job_scores s
+                JOIN jobs j ON j.id = s.job_id
+                WHERE s.candidate_id = ? AND j.status = 'open'
+                ORDER BY s.score DESC, j.id
+                LIMIT ?
+            ''', (candidate_id, limit))
+            
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+            
+        except Exception as e:
+            print(f"Error getting best jobs: {e}")
+            return []
+        finally:
+            conn.close()
+
     def save_interview_session(self, session_data):
         """Save interview session"""
         conn = self.get_connection()
@@ -351,8 +1078,20 @@ class Database:
             else:
                 data[field] = []
         
+        # Missing breakdowns stay None so callers can tell them from empty ones
+        if 'category_breakdown' in data:
+            try:
+                data['category_breakdown'] = json.loads(data['category_breakdown']) if data['category_breakdown'] else None
+            except:
+                data['category_breakdown'] = None
+        
         return data
 
+    @staticmethod
+    def _dumps_optional(value):
+        """JSON-encode value, keeping None as NULL"""
+        return json.dumps(value) if value is not None else None
+
     def search_candidates(self, query):
         """Search candidates by name, email, or skills"""
         conn = self.get_connection()
@@ -360,11 +1099,19 @@ class Database:
         
         try:
             search_term = f"%{query}%"
+            # Skills are matched against the small skills vocabulary and
+            # joined through the index instead of scanning every skills column
+            normalized = self.skill_normalizer([query])
+            skill_term = f"%{normalized[0]}%" if normalized else search_term
             cursor.execute('''
                 SELECT * FROM candidates 
-                WHERE name LIKE ? OR email LIKE ? OR skills LIKE ?
+                WHERE name LIKE ? OR email LIKE ? OR id IN (
+                    SELECT cs.candidate_id FROM candidate_skills cs
+                    JOIN skills s ON s.id = cs.skill_id
+                    WHERE s.name LIKE ?
+                )
                 ORDER BY match_score DESC
-            ''', (search_term, search_term, search_term))
+            ''', (search_term, search_term, skill_term))
             
             rows = cursor.fetchall()
             return [self._row_to_dict(row) for row in rows]
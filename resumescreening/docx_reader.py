@@ -0,0 +1,47 @@
+import zipfile
+import xml.etree.ElementTree as ET
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+PARAGRAPH = WORD_NAMESPACE + 'p'
+TEXT = WORD_NAMESPACE + 't'
+TAB = WORD_NAMESPACE + 'tab'
+BREAK = WORD_NAMESPACE + 'br'
+
+
+def iter_docx_paragraphs(source):
+    """Yield the text of each paragraph in a DOCX file, in document order.
+
+    Streams word/document.xml straight out of the zip with an incremental
+    parser instead of building the python-docx object model. Paragraphs
+    inside table cells are emitted where the table appears, so skills grids
+    are not lost. source is a path or a seekable binary file object.
+    """
+    with zipfile.ZipFile(source) as archive:
+        with archive.open('word/document.xml') as document:
+            # Text boxes can nest paragraphs inside a paragraph, so keep a stack
+            paragraphs = []
+            for event, element in ET.iterparse(document, events=('start', 'end')):
+                tag = element.tag
+                if event == 'start':
+                    if tag == PARAGRAPH:
+                        paragraphs.append([])
+                    continue
+
+                if tag == TEXT:
+                    if paragraphs and element.text:
+                        paragraphs[-1].append(element.text)
+                elif tag == TAB:
+                    if paragraphs:
+                        paragraphs[-1].append('\t')
+                elif tag == BREAK:
+                    if paragraphs:
+                        paragraphs[-1].append('\n')
+                elif tag == PARAGRAPH:
+                    yield ''.join(paragraphs.pop())
+                    # Drop the finished subtree so memory stays flat on big documents
+                    element.clear()
+
+
+def extract_docx_text(source):
+    """Extract DOCX text, one line per paragraph or table-cell paragraph"""
+    return ''.join(paragraph + '\n' for paragraph in iter_docx_paragraphs(source))
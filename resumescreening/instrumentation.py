@@ -0,0 +1,79 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class StageTimings:
+    """Wall time and input size of each stage of one request"""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name, input_size=None):
+        """Time the enclosed block as stage `name`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append({
+                'stage': name,
+                'seconds': time.perf_counter() - start,
+                'input_size': input_size
+            })
+
+    def extend(self, stages):
+        """Add stages recorded elsewhere, e.g. in an isolated parse process"""
+        self.stages.extend(stages)
+
+    def total_seconds(self):
+        return sum(stage['seconds'] for stage in self.stages)
+
+    def to_dict(self):
+        return {
+            'stages': list(self.stages),
+            'total_seconds': self.total_seconds()
+        }
+
+
+def timed(timings, name, input_size=None):
+    """Context manager timing a stage when timings is given, else a no-op"""
+    if timings is None:
+        return nullcontext()
+    return timings.stage(name, input_size)
+
+
+class StageStats:
+    """Thread-safe in-process aggregate of StageTimings across requests"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(self, timings):
+        """Fold one request's stage timings into the aggregate"""
+        with self._lock:
+            for stage in timings.stages:
+                stats = self._stats.setdefault(stage['stage'], {
+                    'count': 0,
+                    'total_seconds': 0.0,
+                    'max_seconds': 0.0,
+                    'total_input_size': 0
+                })
+                stats['count'] += 1
+                stats['total_seconds'] += stage['seconds']
+                stats['max_seconds'] = max(stats['max_seconds'], stage['seconds'])
+                stats['total_input_size'] += stage['input_size'] or 0
+
+    def summary(self):
+        """Per-stage totals, hottest stage (most total time) first"""
+        with self._lock:
+            rows = [dict(stats, stage=name) for name, stats in self._stats.items()]
+        
+        for row in rows:
+            row['mean_seconds'] = row['total_seconds'] / row['count']
+        return sorted(rows, key=lambda row: row['total_seconds'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
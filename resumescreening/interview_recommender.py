@@ -1,5 +1,6 @@
 import random
 from datetime import datetime
+from instrumentation import timed
 
 class InterviewRecommender:
     def __init__(self):
@@ -223,8 +224,17 @@ class InterviewRecommender:
                 'red_flags': 'May require significant training investment'
             }
 
-    def generate_recommendations(self, resume_data, match_score, matched_skills, missing_skills):
-        """Generate comprehensive interview recommendations"""
+    def generate_recommendations(self, resume_data, match_score, matched_skills, missing_skills, timings=None):
+        """Generate comprehensive interview recommendations.
+        
+        Pass an instrumentation.StageTimings as timings to record the stage.
+        """
+        skills = resume_data.get('skills', [])
+        with timed(timings, 'generate_recommendations', len(skills) + len(missing_skills)):
+            return self._generate_recommendations(resume_data, match_score, matched_skills, missing_skills)
+
+    def _generate_recommendations(self, resume_data, match_score, matched_skills, missing_skills):
+        """Build the recommendations returned by generate_recommendations"""
         experience_level = self.determine_experience_level(resume_data.get('experience', []), resume_data.get('skills', []))
         
         # Get interview format
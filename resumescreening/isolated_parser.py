@@ -0,0 +1,126 @@
+import multiprocessing
+from instrumentation import StageTimings, timed
+
+# Structured error codes returned by parse_isolated
+PARSE_TIMEOUT = 'parse_timeout'
+PARSE_OOM = 'parse_oom'
+PARSE_FAILED = 'parse_failed'
+
+# Prefer fork so the child reuses the parent's already loaded SpaCy model
+# instead of loading it again for every document
+if 'fork' in multiprocessing.get_all_start_methods():
+    _context = multiprocessing.get_context('fork')
+else:
+    _context = multiprocessing.get_context()
+
+
+def _address_space_size():
+    """Current virtual memory size of this process in bytes, or 0 if unknown"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmSize:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _limit_memory(memory_limit):
+    """Cap how much more memory this process may allocate"""
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows; run without a memory cap
+        return
+    
+    # RLIMIT_RSS is not enforced by Linux, so cap the address space instead,
+    # leaving room for what the process has already mapped
+    limit = _address_space_size() + memory_limit
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _parse_in_child(conn, parser, source, filename, memory_limit, record_timings):
+    """Child process entry point: parse under a memory cap and report back"""
+    try:
+        _limit_memory(memory_limit)
+        timings = StageTimings() if record_timings else None
+        # Count only this document so the parent can add it to its own counts
+        parser.name_source_counts.clear()
+        resume_data = parser.parse_file(source, filename, timings)
+        conn.send({
+            'resume_data': resume_data,
+            'error': None,
+            'timings': timings.stages if timings else [],
+            'name_source_counts': parser.name_source_counts
+        })
+    except MemoryError:
+        conn.send({'resume_data': None, 'error': PARSE_OOM, 'message': 'Memory limit exceeded while parsing'})
+    except Exception as e:
+        conn.send({'resume_data': None, 'error': PARSE_FAILED, 'message': str(e)})
+    finally:
+        conn.close()
+
+
+def parse_isolated(parser, source, filename=None, timeout=30, memory_limit=512 * 1024 * 1024, timings=None):
+    """Run parser.parse_file in a sandboxed subprocess.
+    
+    The child may allocate at most memory_limit bytes beyond what it starts
+    with and is killed after timeout seconds, so a malformed or adversarial
+    file cannot hang or exhaust the calling worker. Returns a dict with
+    'resume_data' and 'error'; error is None on success, otherwise one of
+    'parse_timeout', 'parse_oom' or 'parse_failed' with a 'message'.
+    Stages timed in the child are added to timings when it is given.
+    """
+    # Hand the child its own copy of streamed uploads
+    if hasattr(source, 'read'):
+        source = source.read()
+    
+    # Load the SpaCy model here, once, rather than in every child. This
+    # also waits out a load running in another thread (e.g. the server's
+    # warmup), so the child is never forked holding a _nlp_lock it cannot
+    # take.
+    with timed(timings, 'load_name_model'):
+        parser.nlp
+    
+    receiver, sender = _context.Pipe(duplex=False)
+    process = _context.Process(
+        target=_parse_in_child,
+        args=(sender, parser, source, filename, memory_limit, timings is not None),
+        daemon=True
+    )
+    process.start()
+    sender.close()
+    
+    try:
+        if receiver.poll(timeout):
+            try:
+                result = receiver.recv()
+                stages = result.pop('timings', [])
+                if timings is not None:
+                    timings.extend(stages)
+                # The child's counters are lost with it; add them here
+                parser.name_source_counts.update(result.pop('name_source_counts', {}))
+                return result
+            except EOFError:
+                # The child died before reporting, e.g. killed by the OOM killer
+                pass
+        else:
+            process.terminate()
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+            return {'resume_data': None, 'error': PARSE_TIMEOUT,
+                    'message': f'Parsing did not finish within {timeout} seconds'}
+    finally:
+        receiver.close()
+        process.join(1)
+    
+    if process.exitcode is not None and process.exitcode < 0:
+        return {'resume_data': None, 'error': PARSE_OOM,
+                'message': f'Parser process was killed (signal {-process.exitcode})'}
+    return {'resume_data': None, 'error': PARSE_FAILED,
+            'message': f'Parser process exited with code {process.exitcode}'}
@@ -0,0 +1,66 @@
+class JobScorer:
+    """Scores of candidates against every open job, kept in candidate_job_scores.
+
+    Candidates are scored a chunk at a time with SkillMatcher.score_matrix,
+    so each chunk against all jobs is a few sparse matrix products instead
+    of a Python loop over (candidate, job) pairs. Only scores are stored;
+    matched and missing skills for a pair come from the SkillIndex bitsets
+    when they are asked for (best_jobs).
+    """
+
+    def __init__(self, db, skill_matcher, chunk_size=2000):
+        self.db = db
+        self.skill_matcher = skill_matcher
+        self.chunk_size = chunk_size
+
+    def score_candidates(self, rows, jobs=None):
+        """Score (candidate_id, skills) rows against jobs (all open jobs by default).
+        
+        Returns the number of scores stored.
+        """
+        if jobs is None:
+            jobs = self.db.get_jobs(status='open')
+        rows = list(rows)
+        if not rows or not jobs:
+            return 0
+        
+        scores = self.skill_matcher.score_matrix(
+            [skills for _, skills in rows], [job['requirements'] for job in jobs]
+        )
+        job_ids = [job['id'] for job in jobs]
+        saved = self.db.save_candidate_job_scores(
+            (candidate_id, job_id, float(score))
+            for (candidate_id, _), candidate_scores in zip(rows, scores)
+            for job_id, score in zip(job_ids, candidate_scores)
+        )
+        return scores.size if saved else 0
+
+    def rescore_jobs(self, job_ids=None):
+        """Score every candidate against the given jobs (all open jobs by default).
+        
+        Returns the number of scores stored.
+        """
+        jobs = self.db.get_jobs(status='open')
+        if job_ids is not None:
+            job_ids = set(job_ids)
+            jobs = [job for job in jobs if job['id'] in job_ids]
+        if not jobs:
+            return 0
+        
+        stored = 0
+        for rows in self.db.iter_candidate_skills(self.chunk_size):
+            stored += self.score_candidates(rows, jobs)
+        return stored
+
+    def best_jobs(self, candidate, limit=5):
+        """Open jobs candidate fits best, each with score, matched_skills and missing_skills"""
+        matcher = self.skill_matcher
+        skill_index = matcher.skill_index
+        candidate_bits = skill_index.to_bits(matcher.normalize_skills(candidate['skills']))
+        
+        jobs = self.db.get_best_jobs(candidate['id'], limit)
+        for job in jobs:
+            plan = matcher.compile_requirements(job['requirements'])
+            job['matched_skills'] = skill_index.to_skills(candidate_bits & plan.required_bits)
+            job['missing_skills'] = skill_index.to_skills(plan.required_bits & ~candidate_bits)
+        return jobs
@@ -0,0 +1,179 @@
+import sqlite3
+import json
+import hashlib
+from datetime import datetime
+
+class ParseCache:
+    """Persistent cache of parse results keyed by file content.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes plus the parser
+    version, so re-uploads of the same file skip extraction and NLP, and a
+    parser change never serves results from older logic. The cache lives in
+    its own table in the application database and evicts least recently
+    used entries once the stored results exceed max_bytes.
+    """
+
+    def __init__(self, parser_version, db_path='resume_screening.db', max_bytes=64 * 1024 * 1024):
+        self.parser_version = parser_version
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.init_table()
+
+    def get_connection(self):
+        """Get database connection"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def init_table(self):
+        """Create the parse cache table"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                content_hash TEXT NOT NULL,
+                parser_version TEXT NOT NULL,
+                result TEXT NOT NULL,  -- JSON object
+                size INTEGER NOT NULL,
+                created_at TEXT,
+                last_accessed TEXT,
+                PRIMARY KEY (content_hash, parser_version)
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_parse_cache_last_accessed
+            ON parse_cache (last_accessed)
+        ''')
+        
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def hash_bytes(data):
+        """SHA-256 hex digest of raw file bytes"""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def hash_stream(stream, chunk_size=64 * 1024):
+        """SHA-256 hex digest of a binary stream, read in chunks from its current position"""
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(chunk_size), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash_file(filepath):
+        """SHA-256 hex digest of a file"""
+        with open(filepath, 'rb') as file:
+            return ParseCache.hash_stream(file)
+
+    def get(self, content_hash):
+        """Return the cached parse result for content_hash, or None"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('''
+                SELECT result FROM parse_cache
+                WHERE content_hash = ? AND parser_version = ?
+            ''', (content_hash, self.parser_version))
+            row = cursor.fetchone()
+            
+            if not row:
+                self.misses += 1
+                return None
+            
+            cursor.execute('''
+                UPDATE parse_cache SET last_accessed = ?
+                WHERE content_hash = ? AND parser_version = ?
+            ''', (datetime.now().isoformat(), content_hash, self.parser_version))
+            conn.commit()
+            
+            self.hits += 1
+            return json.loads(row['result'])
+            
+        except Exception as e:
+            print(f"Error reading parse cache: {e}")
+            self.misses += 1
+            return None
+        finally:
+            conn.close()
+
+    def put(self, content_hash, result):
+        """Store a parse result and evict old entries if over max_bytes"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            payload = json.dumps(result)
+            now = datetime.now().isoformat()
+            cursor.execute('''
+                INSERT OR REPLACE INTO parse_cache (
+                    content_hash, parser_version, result, size, created_at, last_accessed
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', (content_hash, self.parser_version, payload, len(payload), now, now))
+            
+            self._evict(cursor)
+            conn.commit()
+            return True
+            
+        except Exception as e:
+            print(f"Error writing parse cache: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
+
+    def _evict(self, cursor):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        cursor.execute('SELECT COALESCE(SUM(size), 0) AS total FROM parse_cache')
+        excess = cursor.fetchone()['total'] - self.max_bytes
+        if excess <= 0:
+            return
+        
+        cursor.execute('''
+            SELECT content_hash, parser_version, size FROM parse_cache
+            ORDER BY last_accessed ASC
+        ''')
+        victims = []
+        for row in cursor.fetchall():
+            if excess <= 0:
+                break
+            victims.append((row['content_hash'], row['parser_version']))
+            excess -= row['size']
+        
+        cursor.executemany('''
+            DELETE FROM parse_cache WHERE content_hash = ? AND parser_version = ?
+        ''', victims)
+        self.evictions += len(victims)
+
+    def get_statistics(self):
+        """Get hit/miss counters and current cache size"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT COUNT(*) AS entries, COALESCE(SUM(size), 0) AS size FROM parse_cache')
+            row = cursor.fetchone()
+            lookups = self.hits + self.misses
+            
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': row['entries'],
+                'size_bytes': row['size'],
+                'max_bytes': self.max_bytes,
+                'parser_version': self.parser_version
+            }
+            
+        except Exception as e:
+            print(f"Error getting parse cache statistics: {e}")
+            return {}
+        finally:
+            conn.close()
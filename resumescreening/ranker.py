@@ -0,0 +1,189 @@
+import heapq
+
+# Added to every upper bound so float rounding never prunes a candidate
+# whose exact score ties the bound
+BOUND_EPSILON = 1e-9
+
+class CandidateRanker:
+    """Top-K candidates for a requirements text without a full rescore.
+
+    Candidates sharing a skill or TF-IDF term with the requirements
+    (SkillMatcher.overlap_skills) get an upper bound on their score from
+    the skill index alone (see upper_bound). They are scored with
+    match_many in batches, highest bound first, into a size-k min-heap;
+    once the next bound cannot beat the heap's minimum the rest are
+    skipped. Candidates outside the overlap only ever score the bonus for
+    additional skills, so only a few of them are read.
+    """
+
+    def __init__(self, db, skill_matcher, batch_size=256):
+        self.db = db
+        self.skill_matcher = skill_matcher
+        self.batch_size = batch_size
+
+    def bound_context(self, plan, overlap_skills):
+        """Per-requirements data upper_bound needs, computed once per ranking"""
+        overlap_skills = list(overlap_skills)
+        masks, word_masses, bigram_masses = self.skill_matcher.similarity_model.term_masks(
+            overlap_skills, plan.required_text
+        )
+        
+        required_category = {}
+        for category, skills in plan.categories.items():
+            for skill in skills:
+                required_category[skill] = category
+        
+        return {
+            'semantic_masks': dict(zip(overlap_skills, masks)),
+            'word_masses': word_masses,
+            'bigram_masses': bigram_masses,
+            # Semantic bound by mask of reachable words, filled as candidates share masks
+            'semantic_bounds': {},
+            'required_category': required_category,
+            'category_sizes': {category: len(set(skills)) for category, skills in plan.categories.items() if skills}
+        }
+
+    def upper_bound(self, plan, context, skill_count, distinct_skills, shared_skills):
+        """Highest score a candidate with these index counts can reach.
+        
+        Exact match and coverage are known exactly from the number of
+        required skills the candidate has, and the bonus from skill_count.
+        Each category's F1 is at most 2m / (m + R) with m of its R required
+        skills matched, since the candidate has at least m skills in it.
+        Semantic similarity is at most the square root of the requirement
+        vector's weight on the words of the candidate's shared skills and on
+        every bigram of two such words, wherever in its skills they occur.
+        """
+        matcher = self.skill_matcher
+        required_set = plan.required_set
+        required_size = len(required_set)
+        matched_by_category = {}
+        for skill in shared_skills:
+            if skill in required_set:
+                category = context['required_category'][skill]
+                matched_by_category[category] = matched_by_category.get(category, 0) + 1
+        matched = sum(matched_by_category.values())
+        
+        if required_size and matched:
+            exact_match_score = 2 * matched / (distinct_skills + required_size)
+            skill_coverage = matched / required_size
+        else:
+            exact_match_score = skill_coverage = 0.0
+        
+        total_score = 0
+        total_weight = 0
+        for category, required_category_size in context['category_sizes'].items():
+            category_matched = matched_by_category.get(category, 0)
+            total_score += matcher.skill_categories[category] * 2 * category_matched / (category_matched + required_category_size)
+            total_weight += matcher.skill_categories[category]
+        weighted_score = total_score / total_weight if total_weight > 0 else 0
+        
+        masks = context['semantic_masks']
+        mask = 0
+        for skill in shared_skills:
+            mask |= masks.get(skill, 0)
+        semantic_similarity = context['semantic_bounds'].get(mask)
+        if semantic_similarity is None:
+            semantic_mass = sum(mass for j, mass in enumerate(context['word_masses']) if mask >> j & 1)
+            semantic_mass += sum(mass for bigram_mask, mass in context['bigram_masses'] if bigram_mask & mask == bigram_mask)
+            semantic_similarity = min(1.0, semantic_mass ** 0.5)
+            context['semantic_bounds'][mask] = semantic_similarity
+        
+        bound = (
+            exact_match_score * 0.4 +
+            semantic_similarity * 0.3 +
+            skill_coverage * 0.2 +
+            weighted_score * 0.1
+        )
+        
+        if skill_count > len(plan.required_skills):
+            bonus = min((skill_count - len(plan.required_skills)) * 0.05, 0.1)
+            bound = min(bound + bonus, 1.0)
+        
+        return bound + BOUND_EPSILON
+
+    def top_k(self, requirements, k=50):
+        """Best k candidates for requirements, best first.
+        
+        Returns (ranked, stats): ranked is a list of (candidate, score,
+        matched_skills, missing_skills) and stats counts how many
+        candidates were bounded, fully scored and pruned.
+        """
+        matcher = self.skill_matcher
+        plan = matcher.compile_requirements(requirements)
+        overlap_skills = matcher.overlap_skills(plan, self.db.get_skill_vocabulary())
+        
+        bounded = []
+        if overlap_skills:
+            context = self.bound_context(plan, overlap_skills)
+            for candidate_id, skill_count, distinct_skills, shared_skills in self.db.get_skill_overlap(overlap_skills):
+                bound = self.upper_bound(plan, context, skill_count, distinct_skills, shared_skills)
+                bounded.append((bound, candidate_id))
+        bounded.sort(key=lambda item: (-item[0], item[1]))
+        
+        # Min-heap of (score, -candidate_id, matched, missing): the root is
+        # the weakest of the current top k, ties going to the lower id
+        heap = []
+        scored = 0
+        position = 0
+        while position < len(bounded) and k > 0:
+            if len(heap) == k and bounded[position][0] < heap[0][0]:
+                break
+        
+            batch = bounded[position:position + self.batch_size]
+            position += len(batch)
+            rows = self.db.get_candidate_skill_rows([candidate_id for _, candidate_id in batch])
+            results = matcher.match_many(
+                [skills for _, skills, _ in rows], plan,
+                [breakdown for _, _, breakdown in rows]
+            )
+            scored += len(rows)
+        
+            for (candidate_id, _, _), (score, matched_skills, missing_skills) in zip(rows, results):
+                self._push(heap, k, (score, -candidate_id, matched_skills, missing_skills))
+        
+        # Candidates outside the overlap score only their bonus, which
+        # depends on skill_count alone: walk the distinct scores from the
+        # best down and read at most k ids per score
+        unmatched = 0
+        if k > 0:
+            counts_by_score = {}
+            for skill_count in self.db.get_unmatched_skill_counts(overlap_skills):
+                score = matcher.score_without_overlap(skill_count, plan)
+                counts_by_score.setdefault(score, []).append(skill_count)
+            
+            missing_skills = matcher.skill_index.to_skills(plan.required_bits)
+            for score in sorted(counts_by_score, reverse=True):
+                if len(heap) == k and score < heap[0][0]:
+                    break
+                for candidate_id in self.db.get_unmatched_candidate_ids(overlap_skills, counts_by_score[score], k):
+                    self._push(heap, k, (score, -candidate_id, [], list(missing_skills)))
+                    unmatched += 1
+        
+        best = sorted(heap, reverse=True)
+        candidates = {
+            candidate['id']: candidate
+            for candidate in self.db.get_candidates_by_ids([-negative_id for _, negative_id, _, _ in best])
+        }
+        # Candidates deleted while ranking are left out
+        ranked = [
+            (candidates[-negative_id], score, matched_skills, missing_skills)
+            for score, negative_id, matched_skills, missing_skills in best
+            if -negative_id in candidates
+        ]
+        
+        stats = {
+            'overlapping_candidates': len(bounded),
+            'scored_candidates': scored,
+            'pruned_candidates': len(bounded) - scored,
+            'unmatched_candidates_read': unmatched
+        }
+        return ranked, stats
+
+    @staticmethod
+    def _push(heap, k, entry):
+        """Keep entry if it belongs in the top k"""
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
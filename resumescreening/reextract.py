@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Re-run skill and section extraction over stored resume text.
+
+Reads the compressed full text kept in candidate_texts, re-derives skills
+(with their category breakdown), education and experience with the current
+ResumeParser in a process pool, and writes the results back in one transaction per chunk, stamped with the
+current PARSER_VERSION. The original files are never needed, so a skills
+taxonomy change can be applied to existing candidates without re-uploading.
+
+By default only candidates produced by an older parser version are
+processed, so the command is incremental: it can run in the background
+next to the server, be interrupted, and be started again.
+
+    python reextract.py [--db resume_screening.db] [--workers N] [--chunk-size N] [--all]
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from database import Database
+from resume_document import ResumeDocument
+from resume_parser import ResumeParser, PARSER_VERSION
+from skill_matcher import SkillMatcher
+
+# Parser and matcher owned by each worker process, created once by
+# _init_worker. Name extraction and scoring are not rerun, so neither SpaCy
+# nor the similarity model is ever loaded here.
+_worker_parser = None
+_worker_matcher = None
+
+def _init_worker():
+    global _worker_parser, _worker_matcher
+    _worker_parser = ResumeParser()
+    _worker_matcher = SkillMatcher()
+
+def _reextract_chunk(rows):
+    """Re-derive fields for a chunk of (candidate_id, compressed_text) rows"""
+    updates = []
+    for candidate_id, compressed_text in rows:
+        document = ResumeDocument(Database.decompress_text(compressed_text))
+        skills = _worker_parser.extract_skills(document)
+        updates.append((
+            candidate_id,
+            skills,
+            _worker_parser.extract_education(document),
+            _worker_parser.extract_experience(document),
+            _worker_matcher.category_breakdown(skills)
+        ))
+    return updates
+
+def reextract_candidates(db, workers=None, chunk_size=500, stale_only=True):
+    """Re-extract candidates with stored text; returns the number updated.
+    
+    With stale_only, candidates already at PARSER_VERSION are skipped.
+    """
+    updated = 0
+    stale_for_version = PARSER_VERSION if stale_only else None
+    # Keep only a few chunks in flight so memory stays bounded on big tables
+    max_pending = (workers or 4) * 2
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = set()
+        
+        for rows in db.iter_candidate_texts(chunk_size, stale_for_version):
+            pending.add(executor.submit(_reextract_chunk, rows))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                updated += _write_updates(db, done)
+        
+        updated += _write_updates(db, pending)
+    
+    return updated
+
+def _write_updates(db, futures):
+    """Write finished chunks back to the database"""
+    updated = 0
+    for future in futures:
+        updates = future.result()
+        if db.update_candidate_fields(updates, PARSER_VERSION):
+            updated += len(updates)
+    return updated
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract skills and sections from stored resume text")
+    parser.add_argument('--db', default='resume_screening.db', help="Database path")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=500, help="Candidates per worker task and per commit")
+    parser.add_argument('--all', action='store_true', help="Also reprocess candidates already at the current parser version")
+    args = parser.parse_args()
+    
+    db = Database(args.db)
+    stale = db.count_stale_candidates(PARSER_VERSION)
+    print(f"Parser version {PARSER_VERSION}: {stale['reprocessable']} stale candidates to reprocess")
+    
+    start = time.time()
+    updated = reextract_candidates(db, workers=args.workers, chunk_size=args.chunk_size, stale_only=not args.all)
+    print(f"✓ Re-extracted {updated} candidates in {time.time() - start:.1f}s")
+    
+    if stale['missing_text']:
+        print(f"! {stale['missing_text']} stale candidates have no stored text and need a re-upload")
+
+if __name__ == "__main__":
+    main()
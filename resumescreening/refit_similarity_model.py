@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Refit the TF-IDF similarity model used by SkillMatcher.
+
+Fits the vocabulary and IDF weights on the skills taxonomy plus the skills
+of every stored candidate and saves the model atomically, so a running
+server keeps its current model until it restarts. Run it again when the
+taxonomy changes or the candidate corpus has drifted (for example after a
+large import or a reextract.py run).
+
+    python refit_similarity_model.py [--db resume_screening.db] [--output similarity_model.pkl]
+"""
+
+import argparse
+import time
+
+from database import Database
+from similarity_model import SIMILARITY_MODEL_PATH
+from skill_matcher import SkillMatcher
+
+def refit_similarity_model(db, output=SIMILARITY_MODEL_PATH, chunk_size=500):
+    """Fit a model on the taxonomy and stored candidates and save it to output"""
+    # A matcher without a saved model, so nothing is loaded from output
+    matcher = SkillMatcher(similarity_model_path=None)
+    candidate_skill_lists = (
+        skills
+        for rows in db.iter_candidate_skills(chunk_size)
+        for _, skills in rows
+    )
+
+    model = matcher.fit_similarity_model(candidate_skill_lists)
+    model.save(output)
+    return model
+
+def main():
+    parser = argparse.ArgumentParser(description="Refit the TF-IDF similarity model on the stored candidate corpus")
+    parser.add_argument('--db', default='resume_screening.db', help="Database path")
+    parser.add_argument('--output', default=SIMILARITY_MODEL_PATH, help="Where to write the fitted model")
+    args = parser.parse_args()
+
+    start = time.time()
+    model = refit_similarity_model(Database(args.db), args.output)
+    stats = model.get_statistics()
+    print(f"✓ Fitted {stats['vocabulary_size']} terms on {stats['num_documents']} documents "
+          f"in {time.time() - start:.1f}s -> {args.output}")
+
+if __name__ == "__main__":
+    main()
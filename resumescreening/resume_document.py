@@ -0,0 +1,62 @@
+class ResumeDocument:
+    """Extracted resume text plus views of it shared by every extractor.
+
+    The lowercased text, the lines, their lowercased forms, the line start
+    offsets and the section spans are each computed on first use and then
+    reused, so a parse lowercases and splits the text once instead of once
+    per extractor.
+    """
+
+    __slots__ = ('text', '_lower', '_lines', '_lower_lines', '_line_offsets', 'spans')
+
+    def __init__(self, text):
+        self.text = text
+        self._lower = None
+        self._lines = None
+        self._lower_lines = None
+        self._line_offsets = None
+        # Section spans, filled in by ResumeParser.segment_sections
+        self.spans = None
+
+    @classmethod
+    def of(cls, text):
+        """Return text itself if it is already a ResumeDocument, else wrap it"""
+        if isinstance(text, cls):
+            return text
+        return cls(text)
+
+    @property
+    def lower(self):
+        """Lowercased text"""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def lines(self):
+        """Text split on newlines"""
+        if self._lines is None:
+            self._lines = self.text.split('\n')
+        return self._lines
+
+    @property
+    def lower_lines(self):
+        """Lowercased text split on newlines"""
+        if self._lower_lines is None:
+            self._lower_lines = self.lower.split('\n')
+        return self._lower_lines
+
+    @property
+    def line_offsets(self):
+        """Character offset in text at which each line starts"""
+        if self._line_offsets is None:
+            offsets = []
+            position = 0
+            for line in self.lines:
+                offsets.append(position)
+                position += len(line) + 1
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def __len__(self):
+        return len(self.text)
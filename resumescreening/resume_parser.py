@@ -1,31 +1,118 @@
-import spacy
 import re
-import PyPDF2
-from docx import Document
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
+import io
+import os
 import json
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from skill_extractor import SkillExtractor
+from docx_reader import extract_docx_text
+from section_segmenter import SectionSegmenter
+from resume_document import ResumeDocument
+from instrumentation import timed
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+# Bump whenever extraction logic or skills_db changes so results produced by
+# older logic (e.g. in the parse cache) are not reused
+PARSER_VERSION = '6'
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+def ensure_nltk_data():
+    """Download required NLTK data if it is missing"""
+    import nltk
+    
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt')
+    
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+def load_spacy_model():
+    """Load the SpaCy model with only the components NER depends on"""
+    import spacy
+    
+    try:
+        return spacy.load("en_core_web_sm", exclude=NER_EXCLUDE)
+    except OSError:
+        print("SpaCy model not found. Please run: python -m spacy download en_core_web_sm")
+        return None
+
+def _source_size(source):
+    """Size in bytes of a path, bytes or seekable file object, or None"""
+    try:
+        if isinstance(source, str):
+            return os.path.getsize(source)
+        if isinstance(source, (bytes, bytearray)):
+            return len(source)
+        position = source.tell()
+        size = source.seek(0, os.SEEK_END)
+        source.seek(position)
+        return size
+    except Exception:
+        return None
+
+def _as_stream(source):
+    """Wrap bytes in a binary stream; paths and file objects pass through"""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return source
+
+# Marks the SpaCy model as not loaded yet (None means it is unavailable)
+_NOT_LOADED = object()
+
+# Only NER output (doc.ents) is used, so skip loading the rest of the pipeline
+NER_EXCLUDE = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter']
+
+# Characters handed to NER when looking for the candidate name
+NER_WINDOW = 1000
+
+# First-line shape of a name: 2-4 capitalized words, initials and hyphenated
+# or apostrophe names allowed, no digits or symbols
+NAME_LINE_PATTERN = re.compile(r"^[A-Z][A-Za-z'\-]*\.?(?:\s+[A-Z][A-Za-z'\-]*\.?){1,3}$")
+
+# Words that make a name-shaped first line a header or title instead
+NON_NAME_WORDS = {
+    'resume', 'cv', 'curriculum', 'vitae', 'profile', 'summary', 'objective',
+    'contact', 'experience', 'education', 'skills', 'projects', 'references',
+    'engineer', 'developer', 'manager', 'analyst', 'designer', 'consultant',
+    'intern', 'scientist', 'architect', 'specialist', 'administrator',
+    'senior', 'junior', 'lead', 'software', 'data', 'web', 'full', 'stack'
+}
+
+# A line of contact details: email, URL, profile link or phone number
+CONTACT_LINE_PATTERN = re.compile(r'@|https?://|www\.|linkedin|github|\+?\(?\d[\d\s().\-]{7,}\d', re.IGNORECASE)
+
+# Parser owned by each batch worker process, created once by _init_worker
+_worker_parser = None
+
+def _init_worker(parser):
+    """Adopt a copy of the batch's parser and load its models once per worker process"""
+    global _worker_parser
+    _worker_parser = parser.warmup()
+
+def _parse_in_worker(filepaths):
+    """Parse a chunk of files in a worker, reporting failures per file"""
+    return _worker_parser.parse_files(filepaths)
 
 class ResumeParser:
-    def __init__(self):
-        # Load SpaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("SpaCy model not found. Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    def __init__(self, ner_batch_size=32, max_pdf_pages=20, max_pdf_chars=50000):
+        # Documents per nlp.pipe batch when extracting names in bulk
+        self.ner_batch_size = ner_batch_size
+        
+        # PDF extraction budget; stop reading pages once either is reached
+        # (None disables the limit)
+        self.max_pdf_pages = max_pdf_pages
+        self.max_pdf_chars = max_pdf_chars
+        
+        # How often each name extraction path fires, see extract_name_with_source,
+        # plus 'heuristic_rejected' for name-shaped first lines sent to NER
+        self.name_source_counts = Counter()
+        
+        # SpaCy model, loaded on first access to self.nlp
+        self._nlp = _NOT_LOADED
+        self._nlp_lock = threading.Lock()
         
         # Common skills database
         self.skills_db = {
@@ -42,106 +129,280 @@ class ResumeParser:
             'soft_skills': ['leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking', 'time management', 'adaptability']
         }
         
+        # Compiled once so extract_skills scans the text a single time
+        self.skill_extractor = SkillExtractor(
+            skill for skill_list in self.skills_db.values() for skill in skill_list
+        )
+        
         # Education keywords
-        self.education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college', 'school', 'academy', 'institute']
+        self.education_keywords = ['education', 'bachelor', 'master', 'phd', 'degree', 'university', 'college', 'school', 'academy', 'institute']
         
         # Experience keywords
         self.experience_keywords = ['experience', 'work', 'job', 'position', 'role', 'responsibility', 'achievement', 'project']
+        
+        # Skills and contact keywords, also used to end education/experience spans
+        self.skills_keywords = ['skills', 'technologies', 'tools', 'languages', 'frameworks', 'proficient', 'expertise']
+        self.contact_keywords = ['contact', 'email', 'e-mail', 'phone', 'mobile', 'linkedin', 'github.com', 'address']
+        
+        # Other section headers; they only end the span before them
+        self.other_section_keywords = ['summary', 'objective', 'profile', 'interests', 'hobbies', 'references', 'certifications', 'awards']
+        
+        # One segmenter pass classifies every line; earlier sections win ties
+        self.section_segmenter = SectionSegmenter(
+            {
+                'contact': self.contact_keywords,
+                'education': self.education_keywords,
+                'experience': self.experience_keywords,
+                'skills': self.skills_keywords,
+                'other': self.other_section_keywords
+            },
+            # Following lines each section may take in (as in the old windows)
+            {'contact': 1, 'education': 3, 'experience': 4, 'skills': 3, 'other': 0},
+            # Their keywords are common words in experience bullets
+            header_sections={'contact', 'skills'}
+        )
+
+    def __getstate__(self):
+        # Locks cannot be pickled; a copy sent to another process reloads
+        # the SpaCy model lazily there
+        state = self.__dict__.copy()
+        del state['_nlp_lock']
+        state['_nlp'] = _NOT_LOADED
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._nlp_lock = threading.Lock()
+
+    @property
+    def nlp(self):
+        """SpaCy pipeline, loaded on first use (None if the model is missing)"""
+        if self._nlp is _NOT_LOADED:
+            with self._nlp_lock:
+                if self._nlp is _NOT_LOADED:
+                    self._nlp = load_spacy_model()
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp = value
 
-    def extract_text_from_pdf(self, filepath):
-        """Extract text from PDF file"""
+    def warmup(self):
+        """Load all heavy dependencies now instead of on the first resume"""
+        ensure_nltk_data()
+        self.nlp  # Accessing the property loads the model
+        import PyPDF2
+        import docx
+        return self
+
+    def iter_pdf_pages(self, source):
+        """Yield the text of each PDF page, extracting pages only as they are consumed"""
+        import PyPDF2
+        
+        pdf_reader = PyPDF2.PdfReader(_as_stream(source))
+        for page in pdf_reader.pages:
+            yield page.extract_text() or ""
+
+    def extract_text_from_pdf(self, source):
+        """Extract text from PDF file (path, bytes or binary file object).
+        
+        Stops after max_pdf_pages pages or max_pdf_chars characters, so long
+        portfolio PDFs do not pay for pages the extractors never need.
+        """
         try:
-            with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text
+            pages = []
+            chars = 0
+            for page_number, page_text in enumerate(self.iter_pdf_pages(source), 1):
+                pages.append(page_text)
+                chars += len(page_text)
+                if self.max_pdf_chars is not None and chars >= self.max_pdf_chars:
+                    break
+                if self.max_pdf_pages is not None and page_number >= self.max_pdf_pages:
+                    break
+            
+            text = "".join(pages)
+            if self.max_pdf_chars is not None:
+                text = text[:self.max_pdf_chars]
+            return text
+        except MemoryError:
+            # Not a bad file: let parse_isolated report it as parse_oom
+            raise
         except Exception as e:
             print(f"Error reading PDF: {e}")
             return ""
 
-    def extract_text_from_docx(self, filepath):
-        """Extract text from DOCX file"""
+    def extract_text_from_docx(self, source):
+        """Extract text from DOCX file (path, bytes or binary file object)"""
+        # Fast path: stream document.xml, including table cells
         try:
-            doc = Document(filepath)
+            return extract_docx_text(_as_stream(source))
+        except MemoryError:
+            raise
+        except Exception as e:
+            print(f"Falling back to python-docx: {e}")
+        
+        from docx import Document
+        
+        try:
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            doc = Document(_as_stream(source))
             text = ""
             for paragraph in doc.paragraphs:
                 text += paragraph.text + "\n"
             return text
+        except MemoryError:
+            raise
         except Exception as e:
             print(f"Error reading DOCX: {e}")
             return ""
 
-    def extract_text_from_txt(self, filepath):
-        """Extract text from TXT file"""
+    def extract_text_from_txt(self, source):
+        """Extract text from TXT file (path, bytes or binary file object)"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                return file.read()
+            if isinstance(source, str):
+                with open(source, 'r', encoding='utf-8') as file:
+                    return file.read()
+            return _as_stream(source).read().decode('utf-8')
+        except MemoryError:
+            raise
         except Exception as e:
             print(f"Error reading TXT: {e}")
             return ""
 
-    def extract_text(self, filepath):
-        """Extract text from various file formats"""
-        file_extension = filepath.split('.')[-1].lower()
+    def extract_text(self, source, filename=None):
+        """Extract text from various file formats.
+        
+        source is a file path, bytes, or a binary file object. For bytes and
+        file objects, filename supplies the extension that picks the format.
+        """
+        file_extension = (filename or source).split('.')[-1].lower()
         
         if file_extension == 'pdf':
-            return self.extract_text_from_pdf(filepath)
+            return self.extract_text_from_pdf(source)
         elif file_extension == 'docx':
-            return self.extract_text_from_docx(filepath)
+            return self.extract_text_from_docx(source)
         elif file_extension == 'txt':
-            return self.extract_text_from_txt(filepath)
+            return self.extract_text_from_txt(source)
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
 
     def extract_name(self, text):
         """Extract candidate name using NLP"""
+        return self.extract_name_with_source(text)[0]
+
+    def extract_name_with_source(self, text):
+        """Extract candidate name and report which path produced it.
+        
+        The source is 'heuristic' when the first line is confidently a name
+        and NER was skipped, 'ner' for a SpaCy PERSON entity, 'fallback' for
+        the line-shape fallback after NER, and 'none' when nothing matched.
+        """
+        document = ResumeDocument.of(text)
+        name = self.heuristic_name(document)
+        if name:
+            return self._count_name_source(name, 'heuristic')
+        
         if not self.nlp:
-            return "Unknown"
+            return self._count_name_source("Unknown", 'none')
+        
+        doc = self.nlp(document.text[:NER_WINDOW])
+        return self._count_name_source(*self._name_from_doc(doc, document))
+
+    def extract_names(self, texts, batch_size=None):
+        """Extract (name, source) pairs for many documents.
+        
+        Documents resolved by the first-line heuristic skip NER; the rest go
+        through nlp.pipe in batches.
+        """
+        documents = [ResumeDocument.of(text) for text in texts]
+        results = [None] * len(documents)
+        ambiguous = []
+        
+        for i, document in enumerate(documents):
+            name = self.heuristic_name(document)
+            if name:
+                results[i] = self._count_name_source(name, 'heuristic')
+            elif not self.nlp:
+                results[i] = self._count_name_source("Unknown", 'none')
+            else:
+                ambiguous.append(i)
         
-        doc = self.nlp(text[:1000])  # Analyze first 1000 characters
+        if ambiguous:
+            docs = self.nlp.pipe(
+                (documents[i].text[:NER_WINDOW] for i in ambiguous),
+                batch_size=batch_size or self.ner_batch_size
+            )
+            for i, doc in zip(ambiguous, docs):
+                results[i] = self._count_name_source(*self._name_from_doc(doc, documents[i]))
         
+        return results
+
+    def heuristic_name(self, text):
+        """Return the first non-empty line if it is confidently a name, else None"""
+        lines = [line.strip() for line in ResumeDocument.of(text).text[:NER_WINDOW].split('\n')]
+        lines = [line for line in lines if line]
+        if not lines or len(lines[0]) > 60 or not NAME_LINE_PATTERN.match(lines[0]):
+            return None
+        
+        line = lines[0]
+        words = line.split()
+        # Shape alone also accepts headers and job titles ("Software Engineer"),
+        # skill lists ("Python Django"; initials are left out so "John R. Smith"
+        # is not read as the skill 'r'), places and report titles. A name is
+        # followed by the candidate's contact details, so require that too.
+        if (any(word.strip('.').lower() in NON_NAME_WORDS for word in words)
+                or self.skill_extractor.extract(' '.join(word for word in words if len(word.strip('.')) > 1).lower())
+                or len(lines) < 2 or not CONTACT_LINE_PATTERN.search(lines[1])):
+            # Name-shaped but left to NER; with the 'heuristic' count this
+            # shows how often the shape alone would have been trusted
+            self.name_source_counts['heuristic_rejected'] += 1
+            return None
+        return line
+
+    def _count_name_source(self, name, source):
+        """Record which name extraction path was taken"""
+        self.name_source_counts[source] += 1
+        return name, source
+
+    def _name_from_doc(self, doc, text):
+        """Pick the candidate name from NER output, falling back to line heuristics"""
         # Look for person names
         for ent in doc.ents:
             if ent.label_ == "PERSON":
-                return ent.text.strip()
+                return ent.text.strip(), 'ner'
         
         # Fallback: look for patterns like "Name: John Doe" or "John Doe"
-        lines = text.split('\n')
+        lines = ResumeDocument.of(text).lines
         for line in lines[:10]:  # Check first 10 lines
             line = line.strip()
             if line and len(line.split()) <= 4:  # Name should be 1-4 words
                 # Check if it looks like a name (contains letters and possibly spaces)
                 if re.match(r'^[A-Za-z\s]+$', line) and len(line) > 2:
-                    return line
+                    return line, 'fallback'
         
-        return "Unknown"
+        return "Unknown", 'none'
 
     def extract_email(self, text):
         """Extract email address"""
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = re.findall(email_pattern, ResumeDocument.of(text).text)
         return emails[0] if emails else ""
 
     def extract_phone(self, text):
         """Extract phone number"""
         phone_pattern = r'(\+?1?[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
-        phones = re.findall(phone_pattern, text)
+        phones = re.findall(phone_pattern, ResumeDocument.of(text).text)
         if phones:
             return ''.join(phones[0])
         return ""
 
     def extract_skills(self, text):
         """Extract skills from text"""
-        skills = set()
-        text_lower = text.lower()
+        text_lower = ResumeDocument.of(text).lower
         
         # Extract skills from skills database
-        for category, skill_list in self.skills_db.items():
-            for skill in skill_list:
-                if skill.lower() in text_lower:
-                    skills.add(skill.lower())
+        skills = self.skill_extractor.extract(text_lower)
         
         # Look for skill patterns in text
         skill_patterns = [
@@ -162,75 +423,150 @@ class ResumeParser:
         
         return list(skills)
 
+    def segment_sections(self, text):
+        """Split text into non-overlapping education/experience/skills/contact spans"""
+        document = ResumeDocument.of(text)
+        if document.spans is None:
+            document.spans = self.section_segmenter.segment_lines(document.lines)
+        return document.spans
+
     def extract_education(self, text):
         """Extract education information"""
-        education = []
-        lines = text.split('\n')
-        
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in self.education_keywords):
-                # Get the next few lines as education details
-                education_text = line
-                for j in range(1, 4):  # Look at next 3 lines
-                    if i + j < len(lines):
-                        education_text += " " + lines[i + j]
-                education.append(education_text.strip())
-        
-        return education
+        return [span.text for span in self.segment_sections(text) if span.section == 'education']
 
     def extract_experience(self, text):
         """Extract work experience"""
-        experience = []
-        lines = text.split('\n')
-        
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in self.experience_keywords):
-                # Get the next few lines as experience details
-                experience_text = line
-                for j in range(1, 5):  # Look at next 4 lines
-                    if i + j < len(lines):
-                        experience_text += " " + lines[i + j]
-                experience.append(experience_text.strip())
-        
-        return experience
-
-    def parse_resume(self, filepath):
-        """Main method to parse resume and extract all information"""
+        return [span.text for span in self.segment_sections(text) if span.section == 'experience']
+
+    def parse_file(self, source, filename=None, timings=None):
+        """Parse resume and extract all information, raising on failure.
+        
+        Pass an instrumentation.StageTimings as timings to record the wall
+        time and input size of each stage.
+        """
+        with timed(timings, 'extract_text', _source_size(source)):
+            document = ResumeDocument(self._extract_required_text(source, filename))
+        with timed(timings, 'extract_name', min(len(document), NER_WINDOW)):
+            name, name_source = self.extract_name_with_source(document)
+        return self._extract_fields(document, name, name_source, timings)
+
+    def parse_files(self, filepaths):
+        """Parse several resumes, running ambiguous name extraction as one NER batch.
+        
+        Returns one {'path', 'resume_data', 'error'} dict per file, in input
+        order; a file that fails carries its error message instead of data.
+        """
+        results = []
+        documents = []
+        
+        for filepath in filepaths:
+            try:
+                documents.append(ResumeDocument(self._extract_required_text(filepath)))
+                results.append({'path': filepath, 'resume_data': None, 'error': None})
+            except Exception as e:
+                results.append({'path': filepath, 'resume_data': None, 'error': str(e)})
+        
+        names = iter(self.extract_names(documents))
+        documents = iter(documents)
+        for result in results:
+            if result['error'] is not None:
+                continue
+            try:
+                result['resume_data'] = self._extract_fields(next(documents), *next(names))
+            except Exception as e:
+                result['error'] = str(e)
+        
+        return results
+
+    def _extract_required_text(self, source, filename=None):
+        """Extract text from file, raising if nothing could be read"""
+        text = self.extract_text(source, filename)
+        
+        if not text:
+            raise ValueError("Could not extract text from file")
+        
+        return text
+
+    def _extract_fields(self, text, name, name_source, timings=None):
+        """Extract the remaining fields from resume text"""
+        # Shared by every extractor so the text is lowercased and split once
+        document = ResumeDocument.of(text)
+        size = len(document)
+        with timed(timings, 'extract_email', size):
+            email = self.extract_email(document)
+        with timed(timings, 'extract_phone', size):
+            phone = self.extract_phone(document)
+        with timed(timings, 'extract_skills', size):
+            skills = self.extract_skills(document)
+        with timed(timings, 'segment_sections', size):
+            self.segment_sections(document)
+        with timed(timings, 'extract_education', size):
+            education = self.extract_education(document)
+        with timed(timings, 'extract_experience', size):
+            experience = self.extract_experience(document)
+        
+        return {
+            'name': name,
+            'name_source': name_source,
+            'email': email,
+            'phone': phone,
+            'skills': skills,
+            'education': education,
+            'experience': experience,
+            'raw_text': document.text[:1000],  # Store first 1000 chars for debugging
+            'text': document.text  # Full text, stored compressed apart from the candidate row
+        }
+
+    def parse_resume(self, source, filename=None, timings=None):
+        """Main method to parse resume and extract all information.
+        
+        source is a file path, bytes, or a binary file object; filename is
+        required for the latter two to tell the format.
+        """
         try:
-            # Extract text from file
-            text = self.extract_text(filepath)
-            
-            if not text:
-                raise ValueError("Could not extract text from file")
-            
-            # Extract information
-            name = self.extract_name(text)
-            email = self.extract_email(text)
-            phone = self.extract_phone(text)
-            skills = self.extract_skills(text)
-            education = self.extract_education(text)
-            experience = self.extract_experience(text)
-            
-            return {
-                'name': name,
-                'email': email,
-                'phone': phone,
-                'skills': skills,
-                'education': education,
-                'experience': experience,
-                'raw_text': text[:1000]  # Store first 1000 chars for debugging
-            }
+            return self.parse_file(source, filename, timings)
             
         except Exception as e:
             print(f"Error parsing resume: {e}")
-            return {
-                'name': 'Unknown',
-                'email': '',
-                'phone': '',
-                'skills': [],
-                'education': [],
-                'experience': [],
-                'raw_text': ''
-            }
+            return self.empty_result()
+
+    def empty_result(self):
+        """Result returned for a resume that could not be parsed"""
+        return {
+            'name': 'Unknown',
+            'name_source': 'none',
+            'email': '',
+            'phone': '',
+            'skills': [],
+            'education': [],
+            'experience': [],
+            'raw_text': '',
+            'text': ''
+        }
+
+    def parse_many(self, paths, workers=None, chunk_size=None):
+        """Parse many resumes across a process pool.
+        
+        Each worker gets a copy of this parser, so its PDF limits and batch
+        size apply, loads its own SpaCy model and NLTK data once and parses
+        files in chunks of chunk_size (default: ner_batch_size) so names are
+        extracted through nlp.pipe. Results are yielded as soon as each chunk
+        finishes, as dicts with 'path', 'resume_data' and 'error'. A file
+        that fails to parse yields its error message instead of stopping the
+        batch.
+        """
+        paths = list(paths)
+        chunk_size = chunk_size or self.ner_batch_size
+        chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            futures = {executor.submit(_parse_in_worker, chunk): chunk for chunk in chunks}
+            
+            for future in as_completed(futures):
+                try:
+                    yield from future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. killed by the OS)
+                    for path in futures[future]:
+                        yield {'path': path, 'resume_data': None, 'error': str(e)}
@@ -0,0 +1,82 @@
+import re
+from collections import namedtuple
+
+# A run of lines [start, end) belonging to one section, joined into text
+SectionSpan = namedtuple('SectionSpan', ['section', 'start', 'end', 'text'])
+
+# Lowercase words a title-cased header may still contain ("Languages and Tools")
+HEADER_CONNECTORS = {'and', 'of', 'for', 'in', '&', '/', '-', '|'}
+
+
+class SectionSegmenter:
+    """Split resume text into non-overlapping section spans in one pass.
+
+    Each line is classified at most once, against one precompiled regex per
+    section, tried in the order the sections are given. A classified line
+    starts a span that takes in up to that section's window of following
+    lines, stopping early at a header of another section. Other lines,
+    including body lines that mention another section's keyword, continue
+    the span, and no line lands in more than one span.
+
+    Sections in header_sections (e.g. contact and skills, whose keywords
+    such as 'mobile' or 'tools' are common in experience bullets) only
+    classify header-like lines, matching whole keywords.
+    """
+
+    def __init__(self, section_keywords, windows, header_sections=()):
+        # section -> keywords; keywords match at the start of a word, so
+        # 'project' matches 'projects' but 'work' does not match 'network'
+        self.sections = [
+            (section, re.compile(
+                r'\b(?:' + '|'.join(map(re.escape, keywords)) + (r')\b' if section in header_sections else ')'),
+                re.IGNORECASE
+            ), section in header_sections)
+            for section, keywords in section_keywords.items()
+        ]
+        self.windows = windows
+
+    def classify(self, line):
+        """Return the section a line starts, or None"""
+        header = None
+        for section, pattern, header_only in self.sections:
+            if header_only:
+                if header is None:
+                    header = self.is_header(line)
+                if not header:
+                    continue
+            if pattern.search(line):
+                return section
+        return None
+
+    def is_header(self, line):
+        """Whether a line looks like a section header or a short 'Label: value' field"""
+        label = line.split(':', 1)[0].split()
+        if not label or len(label) > 4:
+            return False
+        if ':' in line:
+            return True
+        return all(not word[0].isalpha() or word[0].isupper() or word.lower() in HEADER_CONNECTORS for word in label)
+
+    def segment(self, text):
+        """Return the list of SectionSpans found in text"""
+        return self.segment_lines(text.split('\n'))
+
+    def segment_lines(self, lines):
+        """Return the list of SectionSpans found in already split lines"""
+        labels = [self.classify(line) for line in lines]
+        spans = []
+
+        i = 0
+        while i < len(lines):
+            section = labels[i]
+            if section is None:
+                i += 1
+                continue
+            end = i + 1
+            limit = min(len(lines), i + 1 + self.windows.get(section, 0))
+            while end < limit and (labels[end] in (None, section) or not self.is_header(lines[end])):
+                end += 1
+            spans.append(SectionSpan(section, i, end, ' '.join(lines[i:end]).strip()))
+            i = end
+
+        return spans
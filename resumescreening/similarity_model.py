@@ -0,0 +1,137 @@
+import os
+import pickle
+import tempfile
+import time
+from functools import lru_cache
+
+# Default location of the fitted model, next to the database
+SIMILARITY_MODEL_PATH = 'similarity_model.pkl'
+
+# Bump whenever the saved layout changes so older files are refitted
+MODEL_FORMAT = 1
+
+class SimilarityModel:
+    """TF-IDF model with a fixed vocabulary, used for transform only.
+
+    The vectorizer is fitted once (fit) on the skills taxonomy plus the
+    stored candidate corpus and never refitted afterwards, so one instance
+    can be shared by every request. Each match transforms the candidate
+    text and compares it with the requirement vector, which is cached per
+    requirements text.
+    """
+
+    def __init__(self, vectorizer, num_documents, fitted_at=None, vector_cache_size=256):
+        self.vectorizer = vectorizer
+        self.num_documents = num_documents
+        self.fitted_at = fitted_at if fitted_at is not None else time.time()
+        
+        # Requirement vectors, computed once per distinct text
+        self.vector = lru_cache(maxsize=vector_cache_size)(self._transform_one)
+
+    @classmethod
+    def fit(cls, documents):
+        """Fit the vocabulary and IDF weights on a corpus of skill texts"""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
+        documents = [document for document in documents if document.strip()]
+        vectorizer = TfidfVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2)
+        )
+        vectorizer.fit(documents)
+        
+        return cls(vectorizer, len(documents))
+
+    @classmethod
+    def load(cls, path=SIMILARITY_MODEL_PATH):
+        """Load a model written by save"""
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        
+        if state.get('format') != MODEL_FORMAT:
+            raise ValueError(f"unsupported similarity model format {state.get('format')!r}")
+        
+        return cls(state['vectorizer'], state['num_documents'], state['fitted_at'])
+
+    def save(self, path=SIMILARITY_MODEL_PATH):
+        """Write the model atomically so readers never see a partial file"""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({
+                    'format': MODEL_FORMAT,
+                    'vectorizer': self.vectorizer,
+                    'num_documents': self.num_documents,
+                    'fitted_at': self.fitted_at
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def transform(self, texts):
+        """L2-normalized TF-IDF rows for texts; unknown terms are ignored"""
+        return self.vectorizer.transform(texts)
+
+    def _transform_one(self, text):
+        return self.transform([text])
+
+    def similarities(self, candidate_texts, required_text):
+        """Cosine similarity of each candidate text with required_text"""
+        scores = self.transform(candidate_texts) @ self.vector(required_text).T
+        return scores.toarray().ravel()
+
+    def similarity(self, candidate_text, required_text):
+        """Cosine similarity of one candidate text with required_text"""
+        return float(self.similarities([candidate_text], required_text)[0])
+
+    def term_masks(self, texts, required_text):
+        """Bound data for the cosine with required_text of a document joined from texts.
+        
+        Returns (masks, word_masses, bigram_masses): bit j of masks[i] is set
+        when texts[i] has the j-th word of the requirement vector, whose
+        squared weight is word_masses[j]; bigram_masses pairs each bigram's
+        squared weight with the mask of its two words, as joining texts can
+        form it from any two of them. The cosine is at most the square root
+        of the masses a document's words reach (Cauchy-Schwarz).
+        """
+        analyzer = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        required = self.vector(required_text)
+        weights = dict(zip(required.indices, required.data))
+        terms = sorted(set(analyzer(required_text)))
+        
+        word_bits = {}
+        word_masses = []
+        for term in terms:
+            weight = weights.get(vocabulary.get(term), 0.0)
+            if weight and ' ' not in term:
+                word_bits[term] = 1 << len(word_masses)
+                word_masses.append(weight * weight)
+        
+        bigram_masses = []
+        for term in terms:
+            weight = weights.get(vocabulary.get(term), 0.0)
+            if weight and ' ' in term:
+                mask = 0
+                for word in term.split(' '):
+                    mask |= word_bits.get(word, 0)
+                bigram_masses.append((mask, weight * weight))
+        
+        masks = []
+        for text in texts:
+            mask = 0
+            for term in analyzer(text):
+                mask |= word_bits.get(term, 0)
+            masks.append(mask)
+        return masks, word_masses, bigram_masses
+
+    def get_statistics(self):
+        """Vocabulary size and corpus details for monitoring"""
+        return {
+            'vocabulary_size': len(self.vectorizer.vocabulary_),
+            'num_documents': self.num_documents,
+            'fitted_at': self.fitted_at
+        }
@@ -0,0 +1,86 @@
+import re
+
+# Tokens may carry the punctuation used inside skill names (c++, c#, node.js,
+# scikit-learn), but must start with a letter or digit
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.\-]*')
+
+# Common spellings of a skill token: a version ('html5', 'python3.10',
+# 'c++17'), a 'js' suffix ('reactjs', 'vue.js', 'nodejs') or a web domain
+# ('github.com')
+VERSION_SUFFIX_PATTERN = re.compile(r'^(.*[a-z+#])v?\d+(?:\.\d+)*$')
+DOMAIN_PATTERN = re.compile(r'^([a-z0-9][a-z0-9\-]*)\.(?:com|io|org|net|dev)$')
+
+
+class SkillExtractor:
+    """Find every taxonomy skill in a text with a single pass over its tokens.
+
+    Skills are tokenized once when the extractor is built and stored in a
+    lookup table keyed by their token sequence. Matching walks the text's
+    tokens once and, for tokens that start a known skill, probes the table
+    for every n-gram up to the longest such skill, so the cost depends on
+    the text length and not on how many skills the taxonomy holds. Because
+    matches are made on whole tokens, short skills such as 'r' or 'go' no
+    longer hit inside other words; versioned, 'js'-suffixed and domain
+    spellings of a token are mapped back to the taxonomy token first.
+    """
+
+    def __init__(self, skills):
+        self.skills = {}
+        # Longest skill (in tokens) starting with each first token
+        self.prefix_lengths = {}
+
+        for skill in skills:
+            skill_lower = skill.lower().strip()
+            tokens = tuple(self.tokenize(skill_lower))
+            if not tokens:
+                continue
+            self.skills[tokens] = skill_lower
+            self.prefix_lengths[tokens[0]] = max(self.prefix_lengths.get(tokens[0], 0), len(tokens))
+
+    @staticmethod
+    def tokenize(text):
+        """Split lowercased text into skill tokens"""
+        tokens = []
+        for token in TOKEN_PATTERN.findall(text):
+            # Drop sentence punctuation glued to the end of a word ("python.")
+            token = token.rstrip('.-')
+            if token:
+                tokens.append(token)
+        return tokens
+
+    def canonical_token(self, token):
+        """Taxonomy token a version, 'js' or domain spelling stands for, else token"""
+        variants = []
+        match = VERSION_SUFFIX_PATTERN.match(token)
+        if match:
+            variants.append(match.group(1))
+        if token.endswith('js') and len(token) > 2:
+            base = token[:-2].rstrip('.-')
+            variants.extend([base, base + '.js'])
+        match = DOMAIN_PATTERN.match(token)
+        if match:
+            variants.append(match.group(1))
+
+        for variant in variants:
+            if variant in self.prefix_lengths:
+                return variant
+        return token
+
+    def extract(self, text_lower):
+        """Return the set of taxonomy skills found in already lowercased text"""
+        found = set()
+        tokens = self.tokenize(text_lower)
+        lookup = self.skills.get
+        prefix_lengths = self.prefix_lengths
+
+        tokens = [token if token in prefix_lengths else self.canonical_token(token) for token in tokens]
+        for i, token in enumerate(tokens):
+            max_tokens = prefix_lengths.get(token)
+            if max_tokens is None:
+                continue
+            for n in range(1, min(max_tokens, len(tokens) - i) + 1):
+                skill = lookup(tuple(tokens[i:i + n]))
+                if skill is not None:
+                    found.add(skill)
+
+        return found
@@ -0,0 +1,132 @@
+import threading
+from array import array
+
+def popcount(bits):
+    """Number of set bits in a Python int bitset"""
+    return bits.bit_count() if hasattr(bits, 'bit_count') else bin(bits).count('1')
+
+class SkillIndex:
+    """Dense integer ids for normalized skills, with skill sets as bitsets.
+
+    Every skill gets the next free id the first time it is seen, and a set
+    of skills is a Python int with bit i set for skill id i, so set
+    operations are single integer operations and sizes are popcounts. When
+    built with a categorize function (skill -> category), the index also
+    records each id's category, so a skill set can be split by category
+    with a mask (category_mask) or ids mapped to categories in bulk
+    (category_codes) instead of re-categorizing strings.
+
+    Ids are only ever appended, so bitsets built earlier stay valid. Ids
+    are local to the process. Lookups are safe from any thread; additions
+    take a lock.
+    """
+
+    def __init__(self, skills=(), categorize=None):
+        self._ids = {}
+        self._skills = []
+        self._categorize = categorize
+        # Category of every id as an index into _category_names, plus one
+        # growable little-endian bitset per category; category_mask turns
+        # the latter into an int when the vocabulary has grown
+        self._category_names = []
+        self._category_codes = array('B')
+        self._category_bytes = {}
+        self._category_masks = {}
+        self._lock = threading.Lock()
+        
+        for skill in skills:
+            self.add(skill)
+
+    def __len__(self):
+        return len(self._skills)
+
+    def __contains__(self, skill):
+        return skill in self._ids
+
+    def add(self, skill):
+        """Return the id of skill, assigning the next id if it is new"""
+        skill_id = self._ids.get(skill)
+        if skill_id is not None:
+            return skill_id
+        
+        with self._lock:
+            skill_id = self._ids.get(skill)
+            if skill_id is None:
+                skill_id = len(self._skills)
+                if self._categorize is not None:
+                    self._add_category(skill_id, self._categorize(skill))
+                # Publish the id last so readers never see an id whose
+                # category is not recorded yet
+                self._skills.append(skill)
+                self._ids[skill] = skill_id
+        return skill_id
+
+    def _add_category(self, skill_id, category):
+        """Record the category of a new id (called under the lock)"""
+        if category not in self._category_bytes:
+            self._category_names.append(category)
+            self._category_bytes[category] = bytearray()
+        self._category_codes.append(self._category_names.index(category))
+        
+        category_bytes = self._category_bytes[category]
+        byte = skill_id >> 3
+        if len(category_bytes) <= byte:
+            category_bytes.extend(bytes(byte + 1 - len(category_bytes)))
+        category_bytes[byte] |= 1 << (skill_id & 7)
+
+    def id_of(self, skill):
+        """Id of skill, or None if it has never been added"""
+        return self._ids.get(skill)
+
+    def skill(self, skill_id):
+        """Skill with the given id"""
+        return self._skills[skill_id]
+
+    def vocabulary(self):
+        """All skills in id order"""
+        return list(self._skills)
+
+    def to_bits(self, skills, add=True):
+        """Bitset of skills; unknown skills are added, or skipped with add=False"""
+        bits = 0
+        if add:
+            for skill in skills:
+                bits |= 1 << self.add(skill)
+        else:
+            for skill in skills:
+                skill_id = self._ids.get(skill)
+                if skill_id is not None:
+                    bits |= 1 << skill_id
+        return bits
+
+    def to_skills(self, bits):
+        """Skills in a bitset, in id order"""
+        return [self._skills[skill_id] for skill_id in self.ids(bits)]
+
+    def ids(self, bits):
+        """Ids in a bitset, in ascending order"""
+        ids = []
+        while bits:
+            low_bit = bits & -bits
+            ids.append(low_bit.bit_length() - 1)
+            bits ^= low_bit
+        return ids
+
+    def category_mask(self, category):
+        """Bitset of every indexed skill in category.
+        
+        Rebuilt (one bytes-to-int conversion) only when skills were added
+        since the last call.
+        """
+        size = len(self._skills)
+        cached = self._category_masks.get(category)
+        if cached is None or cached[0] != size:
+            with self._lock:
+                cached = (len(self._skills), int.from_bytes(self._category_bytes.get(category, b''), 'little'))
+                self._category_masks[category] = cached
+        return cached[1]
+
+    def category_codes(self):
+        """Snapshot (categories, codes): codes[i] indexes categories for id i"""
+        with self._lock:
+            return list(self._category_names), self._category_codes.tobytes()
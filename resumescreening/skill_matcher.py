@@ -1,20 +1,58 @@
+import os
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-from collections import Counter
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+from instrumentation import timed
+from similarity_model import SimilarityModel, SIMILARITY_MODEL_PATH
+from skill_index import SkillIndex, popcount
+
+# Characters dropped from skills after synonyms are applied
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+# Job requirements compiled once by SkillMatcher.compile_requirements and
+# reused for every candidate: the normalized required skills (in extraction
+# order, as a tuple), their set, their category breakdown (a read-only
+# mapping of category -> tuple), the text used for semantic similarity and
+# the SkillIndex bitsets of the required skills, overall and per category
+RequirementsPlan = namedtuple(
+    'RequirementsPlan',
+    ['text', 'required_skills', 'required_set', 'categories', 'required_text',
+     'required_bits', 'category_bits']
+)
 
 class SkillMatcher:
-    def __init__(self):
-        self.job_requirements = ""
-        self.vectorizer = TfidfVectorizer(
-            stop_words='english',
-            ngram_range=(1, 2),
-            max_features=1000
-        )
+    """Score candidate skills against job requirements.
+
+    One instance can be shared by all request threads. Everything a match
+    reads is immutable once built: the synonym and category tables are
+    read-only mappings, compiled RequirementsPlans are namedtuples of
+    tuples and frozensets, and the SimilarityModel is only ever used for
+    transform. State that changes over time (the current plan, the loaded
+    model) is replaced by swapping a single reference, never mutated in
+    place, and every intermediate value of a match lives in locals of that
+    call. Callers should read requirements_plan once and pass the plan on.
+    """
+
+    def __init__(self, plan_cache_size=128, similarity_model_path=SIMILARITY_MODEL_PATH,
+                 normalize_cache_size=65536):
+        # Plan of the current job requirements, replaced as a whole by
+        # update_requirements
+        self.requirements_plan = None
+        
+        # Plans for ad-hoc requirement texts passed straight to match_skills
+        self._cached_plan = lru_cache(maxsize=plan_cache_size)(self._build_plan)
+        # Normalized form of each raw skill string; candidate skills repeat
+        # heavily, so rescoring mostly hits this memo
+        self._cached_normalize = lru_cache(maxsize=normalize_cache_size)(self._normalize_skill)
+        # Fitted TF-IDF model, loaded on first access to self.similarity_model
+        self.similarity_model_path = similarity_model_path
+        self._similarity_model = None
+        self._similarity_model_lock = threading.Lock()
         
-        # Skill categories and their weights
-        self.skill_categories = {
+        # Skill categories and their weights (read-only)
+        self.skill_categories = MappingProxyType({
             'technical': 1.0,
             'soft_skills': 0.8,
             'tools': 0.9,
@@ -22,10 +60,27 @@ class SkillMatcher:
             'frameworks': 0.9,
             'databases': 0.8,
             'cloud': 0.9
+        })
+        
+        # Skills of each category; any other skill is 'technical'
+        category_skills = {
+            'languages': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab'],
+            'frameworks': ['react', 'angular', 'vue', 'express', 'django', 'flask', 'spring', 'asp.net', 'laravel'],
+            'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sql server', 'sqlite', 'dynamodb', 'cassandra'],
+            'cloud': ['aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'terraform', 'jenkins', 'git', 'github', 'gitlab'],
+            'tools': ['selenium', 'junit', 'pytest', 'mocha', 'jest', 'cypress', 'postman', 'soapui', 'figma', 'adobe xd', 'sketch', 'photoshop', 'illustrator'],
+            'soft_skills': ['leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking', 'time management', 'adaptability']
         }
+        # Skill -> category lookup built once; the first category listing a
+        # skill wins
+        skill_category_lookup = {}
+        for category, skills in category_skills.items():
+            for skill in skills:
+                skill_category_lookup.setdefault(skill, category)
+        self.skill_category_lookup = MappingProxyType(skill_category_lookup)
         
-        # Common skill synonyms
-        self.skill_synonyms = {
+        # Common skill synonyms (read-only)
+        self.skill_synonyms = MappingProxyType({
             'js': 'javascript',
             'react.js': 'react',
             'node.js': 'nodejs',
@@ -38,32 +93,147 @@ class SkillMatcher:
             'dev ops': 'devops',
             'ui/ux': 'ui ux',
             'ui/ux design': 'ui ux design'
-        }
+        })
+        # All synonyms in one alternation, longest first so 'react.js' wins
+        # over 'js'; a synonym only matches as a whole token, not inside
+        # another word ('json') or dotted name ('next.js')
+        self._synonym_pattern = re.compile(
+            r'(?<![\w.+#])(?:' +
+            '|'.join(re.escape(synonym) for synonym in sorted(self.skill_synonyms, key=len, reverse=True)) +
+            r')(?![\w+#])'
+        )
+        
+        # Integer ids for normalized skills; skill sets are scored as bitsets
+        self.skill_index = SkillIndex(categorize=self.category_of)
+
+    @property
+    def job_requirements(self):
+        """Lowercased text of the current job requirements"""
+        plan = self.requirements_plan
+        return plan.text.lower() if plan is not None else ""
+
+    @property
+    def similarity_model(self):
+        """Fitted SimilarityModel, loaded from disk on first use.
+        
+        Without a saved model (see refit_similarity_model.py) one is fitted
+        in memory on the skills taxonomy alone.
+        """
+        if self._similarity_model is None:
+            with self._similarity_model_lock:
+                if self._similarity_model is None:
+                    self._similarity_model = self._load_similarity_model()
+        return self._similarity_model
+
+    def _load_similarity_model(self):
+        if self.similarity_model_path and os.path.exists(self.similarity_model_path):
+            try:
+                return SimilarityModel.load(self.similarity_model_path)
+            except Exception as e:
+                print(f"Error loading similarity model: {e}")
+        return self.fit_similarity_model()
+
+    def reload_similarity_model(self):
+        """Swap in the model saved on disk, e.g. after a refit.
+        
+        Matches already running keep the model they started with.
+        """
+        with self._similarity_model_lock:
+            self._similarity_model = self._load_similarity_model()
+            return self._similarity_model
+
+    def fit_similarity_model(self, candidate_skill_lists=(), taxonomy=None):
+        """Fit a SimilarityModel on the skills taxonomy plus candidate skill lists.
+        
+        Every taxonomy skill is one document and every candidate one more,
+        all normalized the same way match_skills normalizes its inputs.
+        taxonomy defaults to ResumeParser's skills database.
+        """
+        if taxonomy is None:
+            from resume_parser import ResumeParser
+            taxonomy = [skill for skills in ResumeParser().skills_db.values() for skill in skills]
+        
+        documents = [' '.join(self.normalize_skills([skill])) for skill in taxonomy]
+        documents.extend(' '.join(self.normalize_skills(skills)) for skills in candidate_skill_lists)
+        
+        return SimilarityModel.fit(documents)
+
+    def warmup(self):
+        """Load the similarity model now instead of on the first match"""
+        self.similarity_model  # Accessing the property loads the model
+        return self
 
     def update_requirements(self, requirements):
-        """Update job requirements"""
-        self.job_requirements = requirements.lower()
+        """Update job requirements and return their compiled plan"""
+        # Compile first, then publish with one assignment so concurrent
+        # readers see either the old plan or the new one
+        plan = self.compile_requirements(requirements)
+        self.requirements_plan = plan
+        return plan
+
+    def compile_requirements(self, requirements):
+        """Compile requirements text into a RequirementsPlan (LRU-cached by text)"""
+        return self._cached_plan(requirements)
+
+    def _build_plan(self, requirements):
+        """Extract, normalize and categorize the required skills once"""
+        required_skills = tuple(self.normalize_skills(self.extract_skills_from_text(requirements)))
+        categories = {
+            category: tuple(skills)
+            for category, skills in self.categorize_skills(required_skills).items()
+        }
+        
+        skill_index = self.skill_index
+        category_bits = {
+            category: skill_index.to_bits(skills)
+            for category, skills in categories.items() if skills
+        }
+        
+        return RequirementsPlan(
+            text=requirements,
+            required_skills=required_skills,
+            required_set=frozenset(required_skills),
+            categories=MappingProxyType(categories),
+            required_text=' '.join(required_skills),
+            required_bits=skill_index.to_bits(required_skills),
+            category_bits=MappingProxyType(category_bits)
+        )
 
     def normalize_skills(self, skills):
         """Normalize and clean skills"""
         normalized = []
         for skill in skills:
-            skill_lower = skill.lower().strip()
-            
-            # Apply synonyms
-            for synonym, replacement in self.skill_synonyms.items():
-                if synonym in skill_lower:
-                    skill_lower = skill_lower.replace(synonym, replacement)
-            
-            # Clean up common variations
-            skill_lower = re.sub(r'[^\w\s]', '', skill_lower)
-            skill_lower = skill_lower.strip()
-            
-            if skill_lower and len(skill_lower) > 1:
-                normalized.append(skill_lower)
+            skill_normalized = self._cached_normalize(skill)
+            if skill_normalized:
+                normalized.append(skill_normalized)
         
         return normalized
 
+    def _normalize_skill(self, skill):
+        """Normalized form of one skill ('' if nothing meaningful is left)"""
+        skill_lower = skill.lower().strip()
+        
+        # Apply synonyms
+        synonyms = self.skill_synonyms
+        skill_lower = self._synonym_pattern.sub(lambda match: synonyms[match.group(0)], skill_lower)
+        
+        # Clean up common variations
+        skill_lower = NON_WORD_PATTERN.sub('', skill_lower).strip()
+        
+        return skill_lower if len(skill_lower) > 1 else ''
+
+    def get_normalization_statistics(self):
+        """Hit rate of the normalize_skills memo"""
+        info = self._cached_normalize.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+            'entries': info.currsize,
+            'max_entries': info.maxsize
+        }
+
     def extract_skills_from_text(self, text):
         """Extract skills from text using pattern matching"""
         skills = set()
@@ -112,22 +282,19 @@ class SkillMatcher:
         f1_score = 2 * (precision * recall) / (precision + recall)
         return f1_score
 
-    def calculate_semantic_similarity(self, candidate_skills, required_skills):
+    def calculate_semantic_similarity(self, candidate_skills, required_skills, required_text=None):
         """Calculate semantic similarity using TF-IDF and cosine similarity"""
         if not candidate_skills or not required_skills:
             return 0.0
         
         # Combine skills into text documents
         candidate_text = ' '.join(candidate_skills)
-        required_text = ' '.join(required_skills)
+        if required_text is None:
+            required_text = ' '.join(required_skills)
         
         try:
-            # Create TF-IDF vectors
-            tfidf_matrix = self.vectorizer.fit_transform([candidate_text, required_text])
-            
-            # Calculate cosine similarity
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return similarity
+            # Cosine similarity of TF-IDF vectors from the fixed-vocabulary model
+            return self.similarity_model.similarity(candidate_text, required_text)
         except Exception as e:
             print(f"Error calculating semantic similarity: {e}")
             return 0.0
@@ -145,6 +312,20 @@ class SkillMatcher:
         
         return coverage
 
+    def category_of(self, skill):
+        """Category of a single skill"""
+        return self.skill_category_lookup.get(skill.lower(), 'technical')
+
+    def category_breakdown(self, skills):
+        """Distinct normalized skills per category, for storing with a candidate.
+        
+        Only non-empty categories are included. match_many takes these
+        breakdowns so rescoring does not re-categorize candidate skills.
+        """
+        normalized = self.normalize_skills(skills)
+        categories = self.categorize_skills(sorted(set(normalized)))
+        return {category: skills for category, skills in categories.items() if skills}
+
     def categorize_skills(self, skills):
         """Categorize skills by type"""
         categories = {
@@ -158,36 +339,15 @@ class SkillMatcher:
         }
         
         for skill in skills:
-            skill_lower = skill.lower()
-            
-            # Programming languages
-            if skill_lower in ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab']:
-                categories['languages'].append(skill)
-            # Frameworks
-            elif skill_lower in ['react', 'angular', 'vue', 'express', 'django', 'flask', 'spring', 'asp.net', 'laravel']:
-                categories['frameworks'].append(skill)
-            # Databases
-            elif skill_lower in ['mysql', 'postgresql', 'mongodb', 'redis', 'oracle', 'sql server', 'sqlite', 'dynamodb', 'cassandra']:
-                categories['databases'].append(skill)
-            # Cloud/DevOps
-            elif skill_lower in ['aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'terraform', 'jenkins', 'git', 'github', 'gitlab']:
-                categories['cloud'].append(skill)
-            # Tools
-            elif skill_lower in ['selenium', 'junit', 'pytest', 'mocha', 'jest', 'cypress', 'postman', 'soapui', 'figma', 'adobe xd', 'sketch', 'photoshop', 'illustrator']:
-                categories['tools'].append(skill)
-            # Soft skills
-            elif skill_lower in ['leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking', 'time management', 'adaptability']:
-                categories['soft_skills'].append(skill)
-            # Technical skills (catch-all for other technical skills)
-            else:
-                categories['technical'].append(skill)
+            categories[self.category_of(skill)].append(skill)
         
         return categories
 
-    def calculate_weighted_score(self, candidate_skills, required_skills):
+    def calculate_weighted_score(self, candidate_skills, required_skills, required_categories=None):
         """Calculate weighted score based on skill categories"""
         candidate_categories = self.categorize_skills(candidate_skills)
-        required_categories = self.categorize_skills(required_skills)
+        if required_categories is None:
+            required_categories = self.categorize_skills(required_skills)
         
         total_score = 0
         total_weight = 0
@@ -203,20 +363,72 @@ class SkillMatcher:
         
         return total_score / total_weight if total_weight > 0 else 0
 
-    def match_skills(self, candidate_skills, job_requirements):
-        """Main method to match candidate skills against job requirements"""
-        # Normalize skills
-        candidate_skills = self.normalize_skills(candidate_skills)
+    @staticmethod
+    def _f1_from_counts(matched, candidate_size, required_size):
+        """calculate_exact_match_score from set sizes.
+        
+        With matched > 0, F1 = 2PR / (P + R) simplifies to
+        2 * matched / (|candidate| + |required|); it is 0 otherwise.
+        """
+        if matched == 0:
+            return 0.0
+        return 2 * matched / (candidate_size + required_size)
+
+    def _weighted_score_from_bits(self, candidate_bits, plan):
+        """calculate_weighted_score with each category split off by a bitmask"""
+        skill_index = self.skill_index
+        total_score = 0
+        total_weight = 0
+        
+        for category, required_bits in plan.category_bits.items():
+            weight = self.skill_categories[category]
+            candidate_category_bits = candidate_bits & skill_index.category_mask(category)
+            category_score = self._f1_from_counts(
+                popcount(candidate_category_bits & required_bits),
+                popcount(candidate_category_bits),
+                popcount(required_bits)
+            )
+            total_score += category_score * weight
+            total_weight += weight
+        
+        return total_score / total_weight if total_weight > 0 else 0
+
+    def match_skills(self, candidate_skills, job_requirements, timings=None):
+        """Main method to match candidate skills against job requirements.
         
-        # Extract skills from job requirements
-        required_skills = self.extract_skills_from_text(job_requirements)
-        required_skills = self.normalize_skills(required_skills)
+        job_requirements is either requirements text or a RequirementsPlan
+        from update_requirements/compile_requirements; pass the plan when
+        scoring many candidates against the same requirements. Pass an
+        instrumentation.StageTimings as timings to record each stage.
+        """
+        # Normalize skills and map them to a SkillIndex bitset
+        with timed(timings, 'normalize_candidate_skills', len(candidate_skills)):
+            candidate_skills = self.normalize_skills(candidate_skills)
+            candidate_bits = self.skill_index.to_bits(candidate_skills)
+        
+        # Extract skills from job requirements, or reuse the compiled plan
+        if isinstance(job_requirements, RequirementsPlan):
+            plan = job_requirements
+        else:
+            with timed(timings, 'extract_required_skills', len(job_requirements)):
+                plan = self.compile_requirements(job_requirements)
+        required_skills = plan.required_skills
+        
+        # Set sizes are popcounts of the bitsets
+        matched_bits = candidate_bits & plan.required_bits
+        matched = popcount(matched_bits)
+        required_size = len(plan.required_set)
         
         # Calculate different types of scores
-        exact_match_score = self.calculate_exact_match_score(candidate_skills, required_skills)
-        semantic_similarity = self.calculate_semantic_similarity(candidate_skills, required_skills)
-        skill_coverage = self.calculate_skill_coverage(candidate_skills, required_skills)
-        weighted_score = self.calculate_weighted_score(candidate_skills, required_skills)
+        size = len(candidate_skills) + len(required_skills)
+        with timed(timings, 'exact_match_score', size):
+            exact_match_score = self._f1_from_counts(matched, popcount(candidate_bits), required_size)
+        with timed(timings, 'semantic_similarity', size):
+            semantic_similarity = self.calculate_semantic_similarity(candidate_skills, required_skills, plan.required_text)
+        with timed(timings, 'skill_coverage', size):
+            skill_coverage = matched / required_size if required_size else 0.0
+        with timed(timings, 'weighted_score', size):
+            weighted_score = self._weighted_score_from_bits(candidate_bits, plan)
         
         # Combine scores (weighted average)
         final_score = (
@@ -227,11 +439,8 @@ class SkillMatcher:
         )
         
         # Find matched and missing skills
-        candidate_set = set(candidate_skills)
-        required_set = set(required_skills)
-        
-        matched_skills = list(candidate_set.intersection(required_set))
-        missing_skills = list(required_set - candidate_set)
+        matched_skills = self.skill_index.to_skills(matched_bits)
+        missing_skills = self.skill_index.to_skills(plan.required_bits & ~candidate_bits)
         
         # Add bonus for having additional relevant skills
         if len(candidate_skills) > len(required_skills):
@@ -240,3 +449,267 @@ class SkillMatcher:
             final_score = min(final_score + bonus, 1.0)
         
         return final_score, matched_skills, missing_skills
+
+    def match_many(self, candidate_skill_lists, job_requirements, category_breakdowns=None):
+        """match_skills for many candidates against one plan, with their stored category_breakdowns if given"""
+        import numpy as np
+        
+        if isinstance(job_requirements, RequirementsPlan):
+            plan = job_requirements
+        else:
+            plan = self.compile_requirements(job_requirements)
+        
+        normalized = [self.normalize_skills(skills) for skills in candidate_skill_lists]
+        num_candidates = len(normalized)
+        if num_candidates == 0:
+            return []
+        
+        skill_index = self.skill_index
+        candidate_ids = [sorted({skill_index.add(skill) for skill in skills}) for skills in normalized]
+        num_skills = len(skill_index)
+        candidates = self._id_matrix(candidate_ids, num_skills)
+        
+        # One column of all required skills, then one per required category
+        required_categories = list(plan.category_bits)
+        required_ids = sorted(skill_index.id_of(skill) for skill in plan.required_set)
+        required = self._id_matrix(
+            [required_ids] + [[skill_index.id_of(skill) for skill in set(plan.categories[category])] for category in required_categories],
+            num_skills
+        )
+        counts = (candidates @ required.T).toarray()
+        matched_counts = counts[:, 0]
+        candidate_sizes = np.diff(candidates.indptr)
+        
+        required_size = len(plan.required_set)
+        if required_size:
+            exact_match_scores = self._f1_from_count_arrays(matched_counts, candidate_sizes, required_size)
+            skill_coverage = matched_counts / required_size
+        else:
+            exact_match_scores = np.zeros(num_candidates)
+            skill_coverage = np.zeros(num_candidates)
+        
+        # Weighted score per required category. Required skills of a category
+        # only hold skills of that category, so the matched counts need no
+        # candidate-side mask; the candidate's category size comes from its
+        # stored breakdown, or from the per-id categories when there is none.
+        if category_breakdowns is None:
+            category_breakdowns = [None] * num_candidates
+        uncategorized_rows = [row for row, breakdown in enumerate(category_breakdowns) if breakdown is None]
+        if uncategorized_rows and required_categories:
+            computed_sizes, category_columns = self._category_sizes(candidates[uncategorized_rows])
+        
+        weighted_scores = np.zeros(num_candidates)
+        total_weight = 0
+        for column, category in enumerate(required_categories, 1):
+            weight = self.skill_categories[category]
+            category_sizes = np.array([
+                len(breakdown.get(category, ())) if breakdown is not None else 0
+                for breakdown in category_breakdowns
+            ])
+            if uncategorized_rows:
+                category_sizes[uncategorized_rows] = computed_sizes[:, category_columns[category]]
+            category_scores = self._f1_from_count_arrays(
+                counts[:, column],
+                category_sizes,
+                popcount(plan.category_bits[category])
+            )
+            weighted_scores += category_scores * weight
+            total_weight += weight
+        if total_weight > 0:
+            weighted_scores /= total_weight
+        
+        semantic_similarity = self._semantic_similarity_many(normalized, plan)
+        
+        final_scores = (
+            exact_match_scores * 0.4 +
+            semantic_similarity * 0.3 +
+            skill_coverage * 0.2 +
+            weighted_scores * 0.1
+        )
+        
+        # Add bonus for having additional relevant skills
+        additional_skills = np.array([len(skills) for skills in normalized]) - len(plan.required_skills)
+        bonus = np.minimum(additional_skills * 0.05, 0.1)
+        final_scores = np.where(additional_skills > 0, np.minimum(final_scores + bonus, 1.0), final_scores)
+        
+        # Matched and missing skills in id order, as to_skills gives them
+        required_id_set = set(required_ids)
+        results = []
+        for row, ids in enumerate(candidate_ids):
+            matched_ids = [skill_id for skill_id in ids if skill_id in required_id_set]
+            matched_id_set = set(matched_ids)
+            results.append((
+                float(final_scores[row]),
+                [skill_index.skill(skill_id) for skill_id in matched_ids],
+                [skill_index.skill(skill_id) for skill_id in required_ids if skill_id not in matched_id_set]
+            ))
+        
+        return results
+
+    def score_matrix(self, candidate_skill_lists, job_requirements_list):
+        """(candidates, jobs) array of match_skills scores, via sparse matrix products"""
+        import numpy as np
+        
+        plans = [
+            requirements if isinstance(requirements, RequirementsPlan) else self.compile_requirements(requirements)
+            for requirements in job_requirements_list
+        ]
+        normalized = [self.normalize_skills(skills) for skills in candidate_skill_lists]
+        num_candidates = len(normalized)
+        num_jobs = len(plans)
+        if num_candidates == 0 or num_jobs == 0:
+            return np.zeros((num_candidates, num_jobs))
+        
+        skill_index = self.skill_index
+        candidate_ids = [sorted({skill_index.add(skill) for skill in skills}) for skills in normalized]
+        # Sized after every candidate and required skill has an id
+        num_skills = len(skill_index)
+        candidates = self._id_matrix(candidate_ids, num_skills)
+        # Category sizes from the candidates' own ids, never from masks
+        # spanning the whole vocabulary
+        candidate_category_sizes, category_sizes_columns = self._category_sizes(candidates)
+        
+        # One row per job, then one row per (job, required category); each
+        # category row's weight over its job's total category weight goes in
+        # category_weights so the weighted scores are one more product
+        job_rows = [[skill_index.id_of(skill) for skill in plan.required_set] for plan in plans]
+        category_columns = []
+        category_required_sizes = []
+        category_weights = []
+        for job, plan in enumerate(plans):
+            total_weight = sum(self.skill_categories[category] for category in plan.category_bits)
+            for category, required_bits in plan.category_bits.items():
+                job_rows.append([skill_index.id_of(skill) for skill in set(plan.categories[category])])
+                category_columns.append(category_sizes_columns[category])
+                category_required_sizes.append(popcount(required_bits))
+                weights = np.zeros(num_jobs)
+                weights[job] = self.skill_categories[category] / total_weight
+                category_weights.append(weights)
+        jobs = self._id_matrix(job_rows, num_skills)
+        category_weights = np.array(category_weights).reshape(len(category_columns), num_jobs)
+        
+        counts = (candidates @ jobs.T).toarray()
+        matched_counts = counts[:, :num_jobs]
+        category_matched_counts = counts[:, num_jobs:]
+        candidate_sizes = np.array([len(ids) for ids in candidate_ids])[:, None]
+        
+        required_sizes = np.array([len(plan.required_set) for plan in plans])
+        exact_match_scores = self._f1_from_count_arrays(matched_counts, candidate_sizes, required_sizes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            skill_coverage = np.where(required_sizes > 0, matched_counts / np.where(required_sizes > 0, required_sizes, 1), 0.0)
+        
+        category_scores = self._f1_from_count_arrays(
+            category_matched_counts,
+            candidate_category_sizes[:, category_columns],
+            np.array(category_required_sizes)
+        )
+        weighted_scores = category_scores @ category_weights
+        
+        # Empty candidate or required texts transform to zero rows, which is
+        # the 0.0 calculate_semantic_similarity returns for them
+        similarity_model = self.similarity_model
+        semantic_similarity = (
+            similarity_model.transform([' '.join(skills) for skills in normalized]) @
+            similarity_model.transform([plan.required_text for plan in plans]).T
+        ).toarray()
+        
+        final_scores = (
+            exact_match_scores * 0.4 +
+            semantic_similarity * 0.3 +
+            skill_coverage * 0.2 +
+            weighted_scores * 0.1
+        )
+        
+        # Add bonus for having additional relevant skills
+        additional_skills = (
+            np.array([len(skills) for skills in normalized])[:, None] -
+            np.array([len(plan.required_skills) for plan in plans])[None, :]
+        )
+        bonus = np.minimum(additional_skills * 0.05, 0.1)
+        return np.where(additional_skills > 0, np.minimum(final_scores + bonus, 1.0), final_scores)
+
+    def overlap_skills(self, job_requirements, vocabulary):
+        """Skills of vocabulary a candidate needs to score above score_without_overlap"""
+        if isinstance(job_requirements, RequirementsPlan):
+            plan = job_requirements
+        else:
+            plan = self.compile_requirements(job_requirements)
+        if not plan.required_skills:
+            return set()
+        
+        # Every skill sharing a TF-IDF term with the requirements; any shared
+        # bigram implies a shared unigram, so the rest have no semantic score
+        vocabulary = list(vocabulary)
+        overlap = set(plan.required_skills)
+        if vocabulary:
+            similarities = self.similarity_model.similarities(vocabulary, plan.required_text)
+            overlap.update(skill for skill, similarity in zip(vocabulary, similarities) if similarity > 0)
+        return overlap
+
+    def score_without_overlap(self, skill_count, job_requirements):
+        """match_skills score of a candidate with skill_count skills, none in overlap_skills"""
+        if isinstance(job_requirements, RequirementsPlan):
+            plan = job_requirements
+        else:
+            plan = self.compile_requirements(job_requirements)
+        
+        # Only the bonus for additional skills is left
+        final_score = 0.0
+        if skill_count > len(plan.required_skills):
+            additional_skills = skill_count - len(plan.required_skills)
+            bonus = min(additional_skills * 0.05, 0.1)  # Max 10% bonus
+            final_score = min(final_score + bonus, 1.0)
+        
+        return final_score
+
+    @staticmethod
+    def _f1_from_count_arrays(matched, candidate_sizes, required_sizes):
+        """Vectorized _f1_from_counts"""
+        import numpy as np
+        
+        denominator = candidate_sizes + required_sizes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(matched > 0, 2 * matched / np.where(denominator > 0, denominator, 1), 0.0)
+
+    @staticmethod
+    def _id_matrix(id_rows, num_skills):
+        """CSR matrix with a 1 at (row, skill id) for each row's distinct ids"""
+        import numpy as np
+        from scipy import sparse
+        
+        indptr = np.zeros(len(id_rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(ids) for ids in id_rows])
+        indices = np.fromiter((skill_id for ids in id_rows for skill_id in ids), dtype=np.int64, count=indptr[-1])
+        return sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(len(id_rows), num_skills))
+
+    def _category_sizes(self, candidates):
+        """(sizes, columns): skills per category of each _id_matrix row, and category -> column"""
+        import numpy as np
+        from scipy import sparse
+        
+        categories, codes = self.skill_index.category_codes()
+        codes = np.frombuffer(codes, dtype=np.uint8)
+        # Same row structure, each skill column replaced by its category;
+        # duplicate entries are summed by toarray
+        sizes = sparse.csr_matrix(
+            (candidates.data, codes[candidates.indices], candidates.indptr),
+            shape=(candidates.shape[0], max(len(categories), 1))
+        ).toarray()
+        return sizes, {category: column for column, category in enumerate(categories)}
+
+    def _semantic_similarity_many(self, normalized, plan):
+        """Vectorized calculate_semantic_similarity for every candidate"""
+        import numpy as np
+        
+        similarity = np.zeros(len(normalized))
+        if not plan.required_skills:
+            return similarity
+        
+        # A candidate with no skills scores 0, as in the scalar path
+        rows = [row for row, skills in enumerate(normalized) if skills]
+        if rows:
+            similarity[rows] = self.similarity_model.similarities(
+                [' '.join(normalized[row]) for row in rows], plan.required_text
+            )
+        
+        return similarity